@@ -1,9 +1,14 @@
 # [file name]: audio_device_manager.py
 """Audio device management and selection for recass."""
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 import sounddevice as sd
 from gi.repository import Gtk
 
+from config import load_user_settings, save_user_settings
+
 
 class AudioDeviceManager:
     """Manages audio device selection and configuration."""
@@ -19,33 +24,49 @@ class AudioDeviceManager:
         self.devices = []
         self.mic_dev_name = None
         self.loopback_dev_name = None
+        # Device enumeration is slow, so the list is cached for a short time
+        self._devices_cache_ts = 0.0
+        self._devices_cache_ttl = 5.0
+        self._name_to_index = {}
     
-    def _refresh_devices(self):
-        """Internal method to refresh sounddevice list."""
+    def _refresh_devices(self, force=False):
+        """
+        Internal method to refresh sounddevice list.
+        
+        Args:
+            force: Re-initialize PortAudio to pick up newly attached devices,
+                ignoring the cached list.
+        """
+        if not force and time.monotonic() - self._devices_cache_ts < self._devices_cache_ttl:
+            return
         print("DEBUG: Re-scanning audio devices")
-        sd._terminate()
-        sd._initialize()
+        if force:
+            sd._terminate()
+            sd._initialize()
         self.devices = sd.query_devices()
+        self._name_to_index = {dev['name']: dev['index'] for dev in self.devices
+                               if dev['max_input_channels'] > 0}
+        self._devices_cache_ts = time.monotonic()
         print("DEBUG: Full device list from sounddevice:")
         print(self.devices)
 
     def get_device_ids_from_names(self, mic_name, loopback_name):
-        """Get device IDs from their names, refreshing the device list."""
+        """Get device IDs from their names, refreshing the device list if needed."""
         if not mic_name or not loopback_name:
             print("Warning: Microphone or loopback device name not specified.")
             return None, None
         
         self._refresh_devices()
-        mic_id, loopback_id = None, None
-        
-        try:
-            mic_id = next(dev['index'] for dev in self.devices if dev['name'] == mic_name and dev['max_input_channels'] > 0)
-        except StopIteration:
+        if mic_name not in self._name_to_index or loopback_name not in self._name_to_index:
+            # A device may have been (re)attached since the last scan
+            self._refresh_devices(force=True)
+
+        mic_id = self._name_to_index.get(mic_name)
+        if mic_id is None:
             print(f"Error: Could not find microphone device named '{mic_name}'.")
 
-        try:
-            loopback_id = next(dev['index'] for dev in self.devices if dev['name'] == loopback_name and dev['max_input_channels'] > 0)
-        except StopIteration:
+        loopback_id = self._name_to_index.get(loopback_name)
+        if loopback_id is None:
             print(f"Error: Could not find loopback device named '{loopback_name}'.")
             
         return mic_id, loopback_id
@@ -65,48 +86,37 @@ class AudioDeviceManager:
             current_mic_name = self.mic_dev_name
             current_loopback_name = self.loopback_dev_name
 
-            # Get all devices and separate them into mics and loopbacks
-            self._refresh_devices()
-            all_input_devices = [dev for dev in self.devices
-                                 if dev.get('max_input_channels', 0) > 0]
-            all_input_names = sorted([dev['name'] for dev in all_input_devices])
+            # Get all devices and separate them into mics and loopbacks. PortAudio is only
+            # re-initialized from the refresh button (widget is set) or when a saved device
+            # is missing from the cached list.
+            self._refresh_devices(force=widget is not None)
+            if widget is None and any(name and name not in self._name_to_index
+                                      for name in (current_mic_name, current_loopback_name)):
+                self._refresh_devices(force=True)
 
             # For loopback, show all available input devices to ensure that application
             # audio sources that don't contain 'monitor' in their name are selectable.
-            loopback_devices = all_input_names
-
             # For microphones, filter out devices that are likely to be loopback devices.
-            mic_devices = [name for name in all_input_names if 'monitor' not in name.lower()]
+            mic_devices, loopback_devices = [], []
+            for dev in self.devices:
+                if dev['max_input_channels'] <= 0:
+                    continue
+                name = dev['name']
+                loopback_devices.append(name)
+                if 'monitor' not in name.lower():
+                    mic_devices.append(name)
+            loopback_devices.sort()
+            mic_devices.sort()
 
             # Fallback: If filtering left the mic list empty, populate it with all devices
             # as a safeguard.
             if not mic_devices:
-                mic_devices = all_input_names
-
-            # Populate mic combo
-            self.app.mic_combo.remove_all()
-            for dev_name in mic_devices:
-                self.app.mic_combo.append_text(dev_name)
-            if current_mic_name and current_mic_name in mic_devices:
-                for i, item in enumerate(self.app.mic_combo.get_model()):
-                    if item[0] == current_mic_name:
-                        self.app.mic_combo.set_active(i)
-                        break
-            elif len(mic_devices) > 0:
-                self.app.mic_combo.set_active(0)
-
-
-            # Populate loopback combo
-            self.app.loopback_combo.remove_all()
-            for dev_name in loopback_devices:
-                self.app.loopback_combo.append_text(dev_name)
-            if current_loopback_name and current_loopback_name in loopback_devices:
-                for i, item in enumerate(self.app.loopback_combo.get_model()):
-                    if item[0] == current_loopback_name:
-                        self.app.loopback_combo.set_active(i)
-                        break
-            elif len(loopback_devices) > 0:
-                self.app.loopback_combo.set_active(0)
+                mic_devices = loopback_devices
+
+            # Populate combos through their ListStore directly; ComboBoxText.append_text
+            # re-queries the model for every single item.
+            self._fill_combo(self.app.mic_combo, mic_devices, current_mic_name)
+            self._fill_combo(self.app.loopback_combo, loopback_devices, current_loopback_name)
 
             print("Audio device list refreshed and separated.")
         except Exception as e:
@@ -117,6 +127,20 @@ class AudioDeviceManager:
             if self.app.loopback_combo and hasattr(self.app, 'loopback_combo_handler_id'):
                 self.app.loopback_combo.handler_unblock(self.app.loopback_combo_handler_id)
     
+    @staticmethod
+    def _fill_combo(combo, names, active_name):
+        """Replace the entries of a ComboBoxText and select active_name (or the first entry)."""
+        store = combo.get_model()
+        store.clear()
+        index_by_name = {}
+        for i, name in enumerate(names):
+            store.insert_with_valuesv(i, [0], [name])
+            index_by_name[name] = i
+        if active_name in index_by_name:
+            combo.set_active(index_by_name[active_name])
+        elif names:
+            combo.set_active(0)
+
     def on_device_changed(self, widget):
         """Handle audio device change and restart audio processing."""
         if not self.app.mic_combo or not self.app.loopback_combo:
@@ -135,11 +159,11 @@ class AudioDeviceManager:
         
         # --- Find device IDs ---
         try:
-            # It's better to refresh the device list here to get fresh IDs
+            # The combo boxes were just populated, so this is a no-op while the cache is warm
             self._refresh_devices()
-            new_mic_id = next(dev['index'] for dev in self.devices if dev['name'] == new_mic_name)
-            new_loopback_id = next(dev['index'] for dev in self.devices if dev['name'] == new_loopback_name)
-        except (StopIteration, Exception) as e:
+            new_mic_id = self._name_to_index[new_mic_name]
+            new_loopback_id = self._name_to_index[new_loopback_name]
+        except (KeyError, sd.PortAudioError) as e:
             print(f"Error finding new device IDs: {e}")
             return
             
@@ -150,12 +174,16 @@ class AudioDeviceManager:
 
         # --- NEW VALIDATION LOGIC ---
         try:
-            print(f"Validating mic device: '{new_mic_name}' (ID: {new_mic_id})...")
-            with sd.InputStream(device=new_mic_id, channels=1, dtype='int16'):
-                pass
-            print(f"Validating loopback device: '{new_loopback_name}' (ID: {new_loopback_id})...")
-            with sd.InputStream(device=new_loopback_id, channels=1, dtype='int16'):
-                pass
+            # check_input_settings only queries PortAudio, it does not open the device;
+            # errors when actually opening surface in _start_audio_processing_thread.
+            # Both checks are independent round-trips to the audio server, so run them in parallel.
+            print(f"Validating mic device: '{new_mic_name}' (ID: {new_mic_id}) and "
+                  f"loopback device: '{new_loopback_name}' (ID: {new_loopback_id})...")
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                mic_check = executor.submit(sd.check_input_settings, device=new_mic_id, channels=1, dtype='int16')
+                loopback_check = executor.submit(sd.check_input_settings, device=new_loopback_id, channels=1, dtype='int16')
+                mic_check.result()
+                loopback_check.result()
             print("✅ Audio devices validated successfully.")
         except Exception as e:
             print(f"❌ Error: Failed to open one or more selected audio devices: {e}")
@@ -198,8 +226,6 @@ class AudioDeviceManager:
     
     def save_device_names(self, mic_name, loopback_name):
         """Save selected device names to settings."""
-        from config import load_user_settings, save_user_settings
-        
         try:
             if mic_name and loopback_name:
                 settings = load_user_settings()
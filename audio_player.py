@@ -1,21 +1,58 @@
 import sounddevice as sd
+import soundfile as sf
 import numpy as np
 import numpy.typing as npt
-import torchaudio
-import torch
+
+# torch/torchaudio are imported in the load_audio path only: streaming playback doesn't need them
+
+# Resamplers to 24 kHz keyed by source sample rate, reused across loaded files
+_load_resamplers = {}
+
+
+def _get_load_resampler(sr: int):
+    resampler = _load_resamplers.get(sr)
+    if resampler is None:
+        import torchaudio
+        resampler = torchaudio.transforms.Resample(sr, 24000)
+        _load_resamplers[sr] = resampler
+    return resampler
+
 
 def load_audio(audio_path: str):
+    import torch
+    import torchaudio
     audio_wav, sr = torchaudio.load(audio_path)
     # Resample if necessary
     if sr != 24000:
-        resampler = torchaudio.transforms.Resample(sr, 24000)
-        audio_wav = resampler(audio_wav)
+        audio_wav = _get_load_resampler(sr)(audio_wav)
     audio_wav = audio_wav.mean(dim=0, keepdim=True)
-    # Convert to int16
-    audio_wav = (audio_wav * 32767).to(torch.int16)
+    # Convert to int16 (mean() returned a fresh tensor, so scale it in place)
+    audio_wav = audio_wav.mul_(32767).to(torch.int16)
     return audio_wav.squeeze().numpy(), 24000
 
 
+def open_audio_stream(audio_path: str):
+    """
+    Open an audio file for block-wise playback without decoding it up front.
+
+    Returns:
+        soundfile.SoundFile, or None if libsndfile cannot read the format
+        (e.g. MP3 with libsndfile < 1.1); use load_audio() then.
+    """
+    try:
+        return sf.SoundFile(audio_path)
+    except RuntimeError as e:  # soundfile.LibsndfileError subclasses RuntimeError
+        print(f"Streaming not available for {audio_path}: {e}")
+        return None
+
+
+def read_audio_block(sound_file, frames: int) -> npt.NDArray[np.int16]:
+    """Read the next block of up to `frames` frames as mono int16 at the file's sample rate."""
+    block = sound_file.read(frames, dtype='float32', always_2d=True)
+    mono = block.mean(axis=1) if block.shape[1] > 1 else block[:, 0]
+    return (mono * 32767).astype(np.int16)
+
+
 class AudioPlayer:
     def __init__(self, samplerate=24000):
         self.stream = sd.OutputStream(samplerate=samplerate, channels=1, dtype=np.int16)
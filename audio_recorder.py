@@ -3,12 +3,48 @@
 import threading
 import numpy as np
 import torch
-import torchaudio
 import torchaudio.transforms as T
 import sounddevice as sd
+import soundfile as sf
 
 from config import WHISPER_SAMPLE_RATE, CHUNK_SECONDS, MIX_SAMPLE_RATE
 
+# Frames per sounddevice callback
+BLOCKSIZE = 1024
+
+# Blocks whose peak amplitude stays below this int16 value are treated as silence
+SILENCE_PEAK_THRESHOLD = 32
+
+
+# Resample modules keyed by (orig_freq, new_freq, device); building one synthesizes the sinc kernel
+_resampler_cache = {}
+
+
+def get_resampler(orig_freq, new_freq, device='cpu'):
+    """Return a shared T.Resample for the given rate pair and device, creating it on first use."""
+    key = (orig_freq, new_freq, device)
+    resampler = _resampler_cache.get(key)
+    if resampler is None:
+        resampler = T.Resample(orig_freq=orig_freq, new_freq=new_freq).to(device)
+        _resampler_cache[key] = resampler
+    return resampler
+
+
+def _processing_device():
+    """Pick the torch device for offline processing of whole recordings."""
+    if torch.cuda.is_available():
+        return 'cuda'
+    if torch.backends.mps.is_available():
+        return 'mps'
+    return 'cpu'
+
+
+def int16_to_float32(samples):
+    """Convert int16 PCM to float32 in [-1, 1) with a single cast-and-scale pass."""
+    out = np.empty(samples.size, dtype=np.float32)
+    np.multiply(samples, np.float32(1.0 / 32768.0), out=out, casting='unsafe')
+    return out
+
 
 class AudioRecorder:
     """Handles audio capture from microphone and loopback sources."""
@@ -19,24 +55,27 @@ class AudioRecorder:
         self.transcription_queue = transcription_queue
         self.level_callback = level_callback
         
-        self.mic_buffer = []
-        self.loopback_buffer = []
-        self.mic_buffer_size = 0
-        self.loopback_buffer_size = 0
+        # Preallocated ring buffers for the live transcription chunks (see start_recording)
+        self._mic_ring = None
+        self._loopback_ring = None
+        self._mic_widx = 0
+        self._loopback_widx = 0
         
         self.lock = threading.Lock()
         self.loopback_silence_warning_shown = False
+        # The loopback silence check only looks at about one block per second
+        self._silence_check_counter = 0
+        self._silence_check_every = 1
         
         self.mic_stream = None
         self.loopback_stream = None
         
         self.mic_samplerate = None
         self.loopback_samplerate = None
-        self.mic_resampler = None
-        self.loopback_resampler = None
 
-        self.mic_file_buffer = []
-        self.loopback_file_buffer = []
+        # Raw int16 PCM of the recording, appended block by block
+        self._mic_bytes = bytearray()
+        self._loopback_bytes = bytearray()
         self.is_writing_audio = False
         self.mixed_audio_path = None
 
@@ -62,140 +101,134 @@ class AudioRecorder:
 
     def _process_data(self, indata, source_name):
         """Process incoming audio data from either mic or loopback source."""
-        if self.level_callback:
-            audio_float = indata.flatten().astype(np.float32) / 32768.0
-            rms = np.sqrt(np.mean(audio_float**2))
-            self.level_callback(source_name, rms)
+        level_callback = self.level_callback
+        if level_callback is not None:
+            samples = indata.reshape(-1)
+            # Peak of |x| as uint16 so that abs(-32768) does not wrap around
+            peak = int(np.abs(samples).view(np.uint16).max())
+            if peak < SILENCE_PEAK_THRESHOLD:
+                rms = 0.0
+            else:
+                # RMS on the int16 samples with integer accumulation, no float temporaries
+                samples = samples.astype(np.int64)
+                rms = float(np.sqrt(np.dot(samples, samples) / samples.size)) / 32768.0
+            level_callback(source_name, rms)
 
         with self.lock:
             if self.is_writing_audio:
+                # Copy the block's bytes straight into the recording buffer (no tobytes() temporary)
+                block_bytes = memoryview(np.ascontiguousarray(indata)).cast('B')
                 if source_name == "MIC":
-                    self.mic_file_buffer.append(indata.copy())
+                    self._mic_bytes.extend(block_bytes)
                 else:  # LOOPBACK
-                    self.loopback_file_buffer.append(indata.copy())
-
-            if source_name == "MIC":
-                buffer_list = self.mic_buffer
-                buffer_size = self.mic_buffer_size
-                samplerate = self.mic_samplerate
-                resampler = self.mic_resampler
-                buffer_list_attr = "mic_buffer"
-                buffer_size_attr = "mic_buffer_size"
-            else:  # LOOPBACK
-                buffer_list = self.loopback_buffer
-                buffer_size = self.loopback_buffer_size
-                samplerate = self.loopback_samplerate
-                resampler = self.loopback_resampler
-                buffer_list_attr = "loopback_buffer"
-                buffer_size_attr = "loopback_buffer_size"
-                
-                if not self.loopback_silence_warning_shown:
-                    mean_abs = np.abs(indata).mean()
-                    if mean_abs < 100:
+                    self._loopback_bytes.extend(block_bytes)
+
+        # Each ring buffer is only touched by its own stream's callback thread, so the
+        # chunk bookkeeping runs outside the lock and mic/loopback never wait on each other.
+        if source_name == "MIC":
+            ring = self._mic_ring
+            widx = self._mic_widx
+            samplerate = self.mic_samplerate
+            widx_attr = "_mic_widx"
+        else:  # LOOPBACK
+            ring = self._loopback_ring
+            widx = self._loopback_widx
+            samplerate = self.loopback_samplerate
+            widx_attr = "_loopback_widx"
+            
+            if not self.loopback_silence_warning_shown:
+                self._silence_check_counter += 1
+                if self._silence_check_counter >= self._silence_check_every:
+                    self._silence_check_counter = 0
+                    peak = int(np.abs(indata.reshape(-1)).view(np.uint16).max())
+                    if peak < 100:
                         print(
                             f"\n⚠️  WARNUNG: Loopback-Stream scheint leise "
-                            f"(Amplitude: {mean_abs:.2f}). Audio wird abgespielt?"
+                            f"(Amplitude: {peak}). Audio wird abgespielt?"
                         )
                         self.loopback_silence_warning_shown = True
 
-            new_data = indata.flatten()
-            buffer_list.append(new_data)
-            buffer_size += new_data.size
-            
-            frames_per_chunk = int(samplerate * CHUNK_SECONDS)
-
-            if buffer_size >= frames_per_chunk:
-                full_audio = np.concatenate(buffer_list)
-                chunk = full_audio[:frames_per_chunk]
-                remainder = full_audio[frames_per_chunk:]
-
-                buffer_list.clear()
-                if remainder.size > 0:
-                    buffer_list.append(remainder)
-                    buffer_size = remainder.size
-                else:
-                    buffer_size = 0
-                
-                # Konvertiere zu Float32 für die Weiterverarbeitung
-                audio_float = chunk.astype(np.float32) / 32768.0
-
-                # Resample, falls notwendig
-                if resampler:
-                    audio_torch = torch.from_numpy(audio_float)
-                    audio_resampled = resampler(audio_torch)
-                    audio_final = audio_resampled.numpy()
-                else:
-                    audio_final = audio_float
-                
-                self.transcription_queue.put((audio_final, source_name))
-
-            setattr(self, buffer_size_attr, buffer_size)
+        new_data = indata.reshape(-1)
+        n = new_data.size
+        ring[widx:widx + n] = new_data
+        widx += n
+        
+        frames_per_chunk = int(samplerate * CHUNK_SECONDS)
+        chunk = None
+
+        if widx >= frames_per_chunk:
+            chunk = ring[:frames_per_chunk].copy()
+            # Move the overflow to the front of the ring for the next chunk
+            remainder = widx - frames_per_chunk
+            np.copyto(ring[:remainder], ring[frames_per_chunk:widx])
+            widx = remainder
+        setattr(self, widx_attr, widx)
+
+        if chunk is not None:
+            # Float-Konvertierung und Resampling übernimmt der Transcriber-Thread,
+            # damit der Audio-Callback seine Deadline einhält
+            self.transcription_queue.put((chunk, source_name, samplerate))
 
     def start_audio_file_writing(self, mixed_path):
         """Start capturing audio to file buffers."""
         with self.lock:
             self.mixed_audio_path = mixed_path
-            self.mic_file_buffer.clear()
-            self.loopback_file_buffer.clear()
+            self._mic_bytes = bytearray()
+            self._loopback_bytes = bytearray()
             self.is_writing_audio = True
 
     def stop_audio_file_writing(self):
         """Stop capturing audio and save mixed audio file. Returns the path to the saved file."""
         with self.lock:
             self.is_writing_audio = False
-            mic_buffer_copy = list(self.mic_file_buffer)
-            loopback_buffer_copy = list(self.loopback_file_buffer)
-            self.mic_file_buffer.clear()
-            self.loopback_file_buffer.clear()
+            mic_bytes = self._mic_bytes
+            loopback_bytes = self._loopback_bytes
+            self._mic_bytes = bytearray()
+            self._loopback_bytes = bytearray()
 
-        print(f"🔍 DEBUG: mic_buffer_copy length: {len(mic_buffer_copy)}, loopback_buffer_copy length: {len(loopback_buffer_copy)}, path: {self.mixed_audio_path}")
+        print(f"🔍 DEBUG: mic bytes: {len(mic_bytes)}, loopback bytes: {len(loopback_bytes)}, path: {self.mixed_audio_path}")
         
         if not self.mixed_audio_path:
             print("⚠️  Warning: mixed_audio_path not set")
             return None
         
-        if not mic_buffer_copy and not loopback_buffer_copy:
+        if not mic_bytes and not loopback_bytes:
             print("⚠️  Warning: Both audio buffers are empty")
             return None
 
+        device = _processing_device()
+
         # Process mic audio
-        if mic_buffer_copy:
-            mic_audio_int16 = np.concatenate(mic_buffer_copy, axis=0)
-            mic_audio_float32 = mic_audio_int16.astype(np.float32) / 32768.0
-            mic_tensor = torch.from_numpy(mic_audio_float32.flatten())
-            if self.mic_samplerate != MIX_SAMPLE_RATE:
-                resampler = T.Resample(orig_freq=self.mic_samplerate, new_freq=MIX_SAMPLE_RATE)
-                mic_tensor = resampler(mic_tensor)
+        if mic_bytes:
+            mic_audio_int16 = np.frombuffer(mic_bytes, dtype=np.int16)
+            mic_tensor = self._to_mix_rate(mic_audio_int16, self.mic_samplerate, device)
         else:
             mic_tensor = torch.tensor([], dtype=torch.float32)
 
         # Process loopback audio
-        if loopback_buffer_copy:
-            loopback_audio_int16 = np.concatenate(loopback_buffer_copy, axis=0)
-            loopback_audio_float32 = loopback_audio_int16.astype(np.float32) / 32768.0
-            loopback_tensor = torch.from_numpy(loopback_audio_float32.flatten())
-            if self.loopback_samplerate != MIX_SAMPLE_RATE:
-                resampler = T.Resample(
-                    orig_freq=self.loopback_samplerate, new_freq=MIX_SAMPLE_RATE
-                )
-                loopback_tensor = resampler(loopback_tensor)
+        if loopback_bytes:
+            loopback_audio_int16 = np.frombuffer(loopback_bytes, dtype=np.int16)
+            loopback_tensor = self._to_mix_rate(loopback_audio_int16, self.loopback_samplerate, device)
         else:
             loopback_tensor = torch.tensor([], dtype=torch.float32)
 
-        mic_len = mic_tensor.shape[0]
-        loopback_len = loopback_tensor.shape[0]
-        max_len = max(mic_len, loopback_len)
+        mic_audio = mic_tensor.numpy()
+        loopback_audio = loopback_tensor.numpy()
+        max_len = max(mic_audio.size, loopback_audio.size)
 
         if max_len > 0:
-            # Padding
-            mic_padded = torch.nn.functional.pad(mic_tensor, (0, max_len - mic_len))
-            loopback_padded = torch.nn.functional.pad(loopback_tensor, (0, max_len - loopback_len))
-
-            # Create stereo audio and save (mic on left, loopback on right)
-            mixed_tensor = torch.stack([mic_padded, loopback_padded], dim=0)
-
+            # Stream interleaved stereo frames (mic on left, loopback on right) one second
+            # at a time instead of padding and stacking full-length copies of both channels.
             try:
-                torchaudio.save(self.mixed_audio_path, mixed_tensor, MIX_SAMPLE_RATE, backend="soundfile")
+                block = np.empty((MIX_SAMPLE_RATE, 2), dtype=np.float32)
+                with sf.SoundFile(self.mixed_audio_path, 'w', samplerate=MIX_SAMPLE_RATE, channels=2) as f:
+                    for start in range(0, max_len, MIX_SAMPLE_RATE):
+                        n = min(MIX_SAMPLE_RATE, max_len - start)
+                        for channel, audio in enumerate((mic_audio, loopback_audio)):
+                            part = audio[start:start + n]
+                            block[:part.size, channel] = part
+                            block[part.size:n, channel] = 0.0
+                        f.write(block[:n])
                 print(f"🎤+🖥️ Gemischtes Audio gespeichert in: {self.mixed_audio_path}")
                 return self.mixed_audio_path
             except Exception as e:
@@ -204,14 +237,36 @@ class AudioRecorder:
         
         return None
 
+    @staticmethod
+    def _to_mix_rate(samples_int16, samplerate, device):
+        """
+        Convert a whole int16 recording to a float32 CPU tensor at MIX_SAMPLE_RATE.
+        
+        The resampling runs on the GPU when one is available and falls back to the CPU
+        if that fails (e.g. out of memory for very long meetings).
+        """
+        if device != 'cpu':
+            try:
+                tensor = torch.from_numpy(samples_int16).to(device).to(torch.float32).mul_(1.0 / 32768.0)
+                if samplerate != MIX_SAMPLE_RATE:
+                    tensor = get_resampler(samplerate, MIX_SAMPLE_RATE, device)(tensor)
+                return tensor.cpu()
+            except RuntimeError as e:
+                print(f"⚠️  Resampling auf {device} fehlgeschlagen, nutze CPU: {e}")
+
+        tensor = torch.from_numpy(int16_to_float32(samples_int16))
+        if samplerate != MIX_SAMPLE_RATE:
+            tensor = get_resampler(samplerate, MIX_SAMPLE_RATE)(tensor)
+        return tensor
+
     def start_recording(self):
         """Initialize and start audio streams."""
         # Öffne Streams ohne feste Samplerate, um die Standardrate des Geräts zu verwenden
         self.mic_stream = sd.InputStream(
-            device=self.mic_id, channels=1, dtype='int16', callback=self.mic_callback, blocksize=1024
+            device=self.mic_id, channels=1, dtype='int16', callback=self.mic_callback, blocksize=BLOCKSIZE
         )
         self.loopback_stream = sd.InputStream(
-            device=self.loopback_id, channels=1, dtype='int16', callback=self.loopback_callback, blocksize=1024
+            device=self.loopback_id, channels=1, dtype='int16', callback=self.loopback_callback, blocksize=BLOCKSIZE
         )
 
         # Hole die tatsächliche Samplerate von den Streams
@@ -224,16 +279,13 @@ class AudioRecorder:
         print(f"🎤 Mic-Stream:      Gerät nutzt {self.mic_samplerate} Hz. Resampling nach {WHISPER_SAMPLE_RATE} Hz wird {mic_resample_status}.")
         print(f"🖥️ Loopback-Stream: Gerät nutzt {self.loopback_samplerate} Hz. Resampling nach {WHISPER_SAMPLE_RATE} Hz wird {loopback_resample_status}.")
 
-        # Erstelle Resampler-Objekte, falls die Raten nicht übereinstimmen
-        if self.mic_samplerate != WHISPER_SAMPLE_RATE:
-            self.mic_resampler = T.Resample(
-                orig_freq=self.mic_samplerate, new_freq=WHISPER_SAMPLE_RATE
-            )
-        
-        if self.loopback_samplerate != WHISPER_SAMPLE_RATE:
-            self.loopback_resampler = T.Resample(
-                orig_freq=self.loopback_samplerate, new_freq=WHISPER_SAMPLE_RATE
-            )
+        # Ring-Puffer für die Transkriptions-Chunks (Platz für einen Chunk plus Überlauf)
+        self._mic_ring = np.empty(int(self.mic_samplerate * CHUNK_SECONDS) * 2, dtype=np.int16)
+        self._loopback_ring = np.empty(int(self.loopback_samplerate * CHUNK_SECONDS) * 2, dtype=np.int16)
+        self._mic_widx = 0
+        self._loopback_widx = 0
+        self._silence_check_counter = 0
+        self._silence_check_every = max(1, self.loopback_samplerate // BLOCKSIZE)
 
         # Starte die Streams
         self.mic_stream.start()
@@ -1,7 +1,11 @@
 import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, GLib
-from datetime import datetime
+import threading
+
+# Number of chat messages loaded per page in the protocol view
+PROTOCOL_PAGE_SIZE = 200
+
 
 class ChatBrowserWindow:
     def __init__(self, app):
@@ -12,6 +16,24 @@ class ChatBrowserWindow:
         self.stack = None
         self.protocol_text_view = None
         self.all_chats = []
+        self._search_timeout_id = None
+        self._search_handler_id = None
+        # Incremented per request so that results of superseded DB fetches are dropped
+        self._search_seq = 0
+        self._protocol_seq = 0
+        # Chat sessions as of db.sessions_epoch; only the filter re-runs while it is current
+        self._chats_cache = None
+        self._chats_cache_epoch = -1
+        # (chat, lowercased title) pairs built once per cache epoch for title filtering
+        self._lower_index = []
+        # Recycled list rows as (row, date_label, title_label) and the chat bound to each
+        self._row_pool = []
+        self._row_chats = []
+        # Paging state of the open chat protocol; older pages load when scrolling to the top
+        self._protocol_session_id = None
+        self._protocol_oldest = None
+        self._protocol_has_more = False
+        self._protocol_loading = False
 
     def create_or_show(self):
         if self._window:
@@ -21,6 +43,7 @@ class ChatBrowserWindow:
         self._window = Gtk.Window(title="Chat Browser")
         self._window.set_default_size(1000, 700)
         self._window.connect("delete-event", self._on_delete_event)
+        self._window.connect("destroy", self._on_destroy)
 
         main_grid = Gtk.Grid()
         self._window.add(main_grid)
@@ -55,7 +78,7 @@ class ChatBrowserWindow:
         self.search_entry = Gtk.SearchEntry()
         self.search_entry.set_placeholder_text("Search Chats...")
         self.search_entry.set_hexpand(True)
-        self.search_entry.connect("search-changed", self._on_search_changed)
+        self._search_handler_id = self.search_entry.connect("search-changed", self._on_search_changed)
         header_bar.pack_start(self.search_entry, True, True, 10)
 
         return header_bar
@@ -88,14 +111,15 @@ class ChatBrowserWindow:
         protocol_vbox.set_margin_top(10)
         protocol_vbox.set_margin_bottom(10)
 
-        header_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=10)
+        header_box = Gtk.Grid(column_spacing=10)
         back_button = Gtk.Button(label="< Back to List")
         back_button.connect("clicked", self._on_back_to_list_clicked)
-        header_box.pack_start(back_button, False, False, 0)
+        header_box.attach(back_button, 0, 0, 1, 1)
 
         self.protocol_title_label = Gtk.Label(label="", use_markup=True)
         self.protocol_title_label.set_halign(Gtk.Align.START)
-        header_box.pack_start(self.protocol_title_label, True, True, 0)
+        self.protocol_title_label.set_hexpand(True)
+        header_box.attach(self.protocol_title_label, 1, 0, 1, 1)
         protocol_vbox.pack_start(header_box, False, False, 0)
 
         scrolled_window = Gtk.ScrolledWindow()
@@ -107,6 +131,7 @@ class ChatBrowserWindow:
         self.protocol_text_view.set_editable(False)
         self.protocol_text_view.set_wrap_mode(Gtk.WrapMode.WORD)
         scrolled_window.add(self.protocol_text_view)
+        scrolled_window.get_vadjustment().connect("value-changed", self._on_protocol_scrolled)
         
         # Add tags for styling
         tag_table = self.protocol_text_view.get_buffer().get_tag_table()
@@ -126,101 +151,212 @@ class ChatBrowserWindow:
         return protocol_vbox
 
     def _load_chats(self, filter_text=None):
-        for child in self.chat_list_box.get_children():
-            self.chat_list_box.remove(child)
+        """Fetch chats on a worker thread; the list is rebuilt on the GTK thread afterwards."""
+        self._search_seq += 1
+        threading.Thread(target=self._fetch_chats_async, args=(filter_text, self._search_seq), daemon=True).start()
+
+    def _fetch_chats_async(self, filter_text, seq):
+        epoch = self.app.db.sessions_epoch
+        if self._chats_cache is None or self._chats_cache_epoch != epoch:
+            chats = self.app.db.get_chat_sessions_with_stats()
+            for chat in chats:
+                # Escape once per cache epoch; titles may contain '&', '<' or '>'
+                chat['_title_markup'] = GLib.markup_escape_text(chat['title'])
+            self._lower_index = [(chat, chat['title'].lower()) for chat in chats]
+            self._chats_cache = chats
+            self._chats_cache_epoch = epoch
 
-        all_chats_from_db = self.app.db.get_chat_sessions()
-        
-        chats_to_display = []
         if not filter_text:
-            chats_to_display = all_chats_from_db
+            chats = list(self._chats_cache)
         else:
-            filter_text_lower = filter_text.lower()
-            for chat in all_chats_from_db:
-                # Check if filter_text is in chat title
-                if filter_text_lower in chat['title'].lower():
-                    chats_to_display.append(chat)
-                    continue # Move to next chat if title matches
-
-                # Check if filter_text is in any message content
-                messages = self.app.db.get_messages_for_session(chat['id'])
-                for message in messages:
-                    if filter_text_lower in message['content'].lower():
-                        chats_to_display.append(chat)
-                        break # Found a match, move to next chat
-        
-        # Sort chats by creation date (most recent first) after filtering
-        chats_to_display.sort(key=lambda c: c['created_at'], reverse=True)
-
-        for chat in chats_to_display:
-            self._add_chat_card(chat)
-        self.chat_list_box.show_all()
-
-    def _add_chat_card(self, chat):
+            # Titles are matched in memory; message contents through the full-text index.
+            # Filtering keeps the newest-first order of get_chat_sessions().
+            query = filter_text.lower()
+            matching_ids = self.app.db.search_chat_sessions(filter_text)
+            chats = [chat for chat, title_lower in self._lower_index
+                     if query in title_lower or chat['id'] in matching_ids]
+        GLib.idle_add(self._populate_chat_list, chats, seq)
+
+    def _populate_chat_list(self, chats_to_display, seq):
+        if seq != self._search_seq:
+            return False  # A newer search is in flight
+
+        # Creating many rows while attached makes the ListBox re-measure after every
+        # insert, so take it out of the viewport until the batch is done
+        parent = None
+        if len(chats_to_display) - len(self._row_pool) > 10:
+            parent = self.chat_list_box.get_parent()
+            self.chat_list_box.freeze_child_notify()
+            parent.remove(self.chat_list_box)
+
+        # Rebind existing rows instead of destroying and rebuilding them
+        for index, chat in enumerate(chats_to_display):
+            if index == len(self._row_pool):
+                self._row_pool.append(self._add_chat_card(index))
+                self._row_chats.append(chat)
+            else:
+                self._row_chats[index] = chat
+            row, date_label, title_label = self._row_pool[index]
+            self._bind_chat_card(date_label, title_label, chat)
+            row.show()
+
+        for row, _, _ in self._row_pool[len(chats_to_display):]:
+            row.hide()
+
+        if parent is not None:
+            parent.add(self.chat_list_box)
+            self.chat_list_box.thaw_child_notify()
+            self.chat_list_box.show()
+        return False
+
+    def _add_chat_card(self, index):
+        """Create a list row for the pool slot at index; its content is set by _bind_chat_card."""
         card = Gtk.Button()
         card.set_relief(Gtk.ReliefStyle.NONE)
-        card.connect("clicked", self._show_chat_protocol, chat)
+        card.connect("clicked", self._on_chat_card_clicked, index)
 
-        hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=15)
-        card.add(hbox)
+        # A Grid measures its children once, unlike a Box distributing spare space
+        grid = Gtk.Grid(column_spacing=15)
+        card.add(grid)
 
-        try:
-            created_at_dt = datetime.fromisoformat(chat['created_at'])
-            formatted_date = created_at_dt.strftime("%Y-%m-%d %H:%M")
-        except (ValueError, TypeError):
-            formatted_date = "Unknown Date"
-            
-        date_label = Gtk.Label(label=f"{formatted_date}", use_markup=True)
+        date_label = Gtk.Label(use_markup=True)
         date_label.set_halign(Gtk.Align.START)
         
-        title_label = Gtk.Label(label=f"<b>{chat['title']}</b>", use_markup=True)
+        title_label = Gtk.Label(use_markup=True)
         title_label.set_halign(Gtk.Align.START)
         title_label.set_line_wrap(True)
+        title_label.set_hexpand(True)
 
-        hbox.pack_start(date_label, False, False, 0)
-        hbox.pack_start(title_label, True, True, 0)
+        grid.attach(date_label, 0, 0, 1, 1)
+        grid.attach(title_label, 1, 0, 1, 1)
         
         row = Gtk.ListBoxRow()
         row.add(card)
         self.chat_list_box.add(row)
+        row.show_all()
+        return row, date_label, title_label
+
+    def _bind_chat_card(self, date_label, title_label, chat):
+        date_label.set_label(f"{chat['_formatted_date']}  ·  {chat['msg_count']} msgs")
+        title_label.set_label(f"<b>{chat['_title_markup']}</b>")
+
+    def _on_chat_card_clicked(self, widget, index):
+        self._show_chat_protocol(widget, self._row_chats[index])
 
     def _show_chat_protocol(self, widget, chat):
-        self.protocol_title_label.set_label(f"<big><b>{chat['title']}</b></big>")
-        
-        messages = self.app.db.get_messages_for_session(chat['id'])
-        
-        buffer = self.protocol_text_view.get_buffer()
-        buffer.set_text("")
-        
+        self.protocol_title_label.set_label(f"<big><b>{chat['_title_markup']}</b></big>")
+        self.protocol_text_view.get_buffer().set_text("")
+        self.stack.set_visible_child_name("protocol_view")
+
+        self._protocol_session_id = chat['id']
+        self._protocol_oldest = None
+        self._protocol_has_more = False
+        self._fetch_protocol_page()
+
+    def _fetch_protocol_page(self):
+        """Load the next (older) page of the open chat on a worker thread."""
+        self._protocol_seq += 1
+        self._protocol_loading = True
+        threading.Thread(
+            target=self._fetch_protocol_async,
+            args=(self._protocol_session_id, self._protocol_oldest, self._protocol_seq),
+            daemon=True
+        ).start()
+
+    def _fetch_protocol_async(self, session_id, before, seq):
+        messages = self.app.db.get_messages_for_session(session_id, limit=PROTOCOL_PAGE_SIZE, before=before)
+        GLib.idle_add(self._populate_chat_protocol, messages, before is None, seq)
+
+    def _on_protocol_scrolled(self, adjustment):
+        if (adjustment.get_value() <= adjustment.get_lower() + 50
+                and self._protocol_has_more and not self._protocol_loading):
+            self._fetch_protocol_page()
+
+    def _populate_chat_protocol(self, messages, first_page, seq):
+        if seq != self._protocol_seq:
+            return False  # Another chat was opened meanwhile
+
+        self._protocol_loading = False
+        self._protocol_has_more = len(messages) == PROTOCOL_PAGE_SIZE
+        if messages:
+            self._protocol_oldest = (messages[0]['created_at'], messages[0]['rowid'])
+
+        # Assemble the whole page first and insert it in one go, then apply the
+        # styling tags over the recorded (start, end) character offsets.
+        parts = []
+        tag_ranges = []
+        offset = 0
         for msg in messages:
-            try:
-                created_at_dt = datetime.fromisoformat(msg['created_at'])
-                timestamp = created_at_dt.strftime("%Y-%m-%d %H:%M:%S")
-            except (ValueError, TypeError):
-                timestamp = "Unknown Time"
-            
+            timestamp = msg['_formatted_time']
             role = msg.get('role', 'unknown').lower()
             
-            # Insert timestamp
-            buffer.insert_with_tags_by_name(buffer.get_end_iter(), f"[{timestamp}] ", "system")
-            
-            # Insert role and content
+            # Timestamp, role and content
+            segments = [(f"[{timestamp}] ", "system")]
             if role == 'user':
-                buffer.insert_with_tags_by_name(buffer.get_end_iter(), "User: ", "user")
+                segments.append(("User: ", "user"))
             elif role == 'assistant':
-                buffer.insert_with_tags_by_name(buffer.get_end_iter(), "Assistant: ", "assistant")
-            
-            buffer.insert(buffer.get_end_iter(), msg.get('content', '') + "\n\n")
+                segments.append(("Assistant: ", "assistant"))
+            segments.append((msg.get('content', '') + "\n\n", None))
 
-        self.stack.set_visible_child_name("protocol_view")
+            for text, tag in segments:
+                if tag:
+                    tag_ranges.append((tag, offset, offset + len(text)))
+                parts.append(text)
+                offset += len(text)
+
+        buffer = self.protocol_text_view.get_buffer()
+        buffer.begin_user_action()
+        try:
+            if first_page:
+                buffer.set_text("".join(parts))
+            else:
+                # Older messages go in front; keep the previous first line in view
+                anchor = buffer.create_mark(None, buffer.get_start_iter(), False)
+                buffer.insert(buffer.get_start_iter(), "".join(parts))
+            for tag, start, end in tag_ranges:
+                buffer.apply_tag_by_name(tag, buffer.get_iter_at_offset(start), buffer.get_iter_at_offset(end))
+        finally:
+            buffer.end_user_action()
+
+        if first_page:
+            buffer.place_cursor(buffer.get_end_iter())
+            self.protocol_text_view.scroll_to_mark(buffer.get_insert(), 0.0, True, 0.0, 1.0)
+        else:
+            self.protocol_text_view.scroll_to_mark(anchor, 0.0, True, 0.0, 0.0)
+            buffer.delete_mark(anchor)
+        return False
 
     def _on_back_to_list_clicked(self, button):
         self.stack.set_visible_child_name("list_view")
 
     def _on_search_changed(self, search_entry):
+        # Debounce: only reload once typing pauses for 200 ms
+        if self._search_timeout_id is not None:
+            GLib.source_remove(self._search_timeout_id)
         query = search_entry.get_text().strip()
+        self._search_timeout_id = GLib.timeout_add(200, self._do_search, query)
+
+    def _do_search(self, query):
+        self._search_timeout_id = None
         self._load_chats(filter_text=query)
+        return False
 
     def _on_delete_event(self, widget, event):
         self._window.hide()
         return True
+
+    def _on_destroy(self, widget):
+        # Drop the pending search and make in-flight worker results stale
+        if self._search_timeout_id is not None:
+            GLib.source_remove(self._search_timeout_id)
+            self._search_timeout_id = None
+        if self._search_handler_id is not None:
+            self.search_entry.disconnect(self._search_handler_id)
+            self._search_handler_id = None
+        self._search_seq += 1
+        self._protocol_seq += 1
+        self._protocol_loading = False
+        # The pooled rows died with the window; the next one starts from scratch
+        self._row_pool = []
+        self._row_chats = []
+        self._window = None
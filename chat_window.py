@@ -3,6 +3,7 @@
 
 import os
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from gi.repository import Gtk
 from config import load_user_settings
@@ -25,6 +26,7 @@ class ChatWindow:
         self.chat_buffer = None
         self.chat_entry = None
         self.ollama_analyzer = None
+        self._analyzer_lock = threading.Lock()
     
     def create_or_show(self):
         """Create or present the chat GTK window."""
@@ -58,6 +60,8 @@ class ChatWindow:
         self.chat_view.set_wrap_mode(Gtk.WrapMode.WORD)
         self.chat_view.set_editable(False)
         self.chat_buffer = self.chat_view.get_buffer()
+        # Single right-gravity mark at the end, moved instead of created per message
+        self._end_mark = self.chat_buffer.create_mark("end", self.chat_buffer.get_end_iter(), False)
         scrolled.add(self.chat_view)
         vbox.pack_start(scrolled, True, True, 0)
         
@@ -79,6 +83,16 @@ class ChatWindow:
         vbox.pack_start(hbox, False, False, 0)
         
         self.window.show_all()
+
+        # Create the analyzer and open its connection before the first message is sent
+        threading.Thread(target=self._prewarm_analyzer, daemon=True).start()
+
+    def _prewarm_analyzer(self):
+        """Construct the Ollama analyzer and establish a pooled connection."""
+        try:
+            self.get_analyzer()._check_connection()
+        except Exception as e:
+            print(f"Ollama prewarm failed: {e}")
     
     def _on_close(self, widget, event):
         """Handle the chat window closing event."""
@@ -100,8 +114,8 @@ class ChatWindow:
             end_iter = self.chat_buffer.get_end_iter()
             self.chat_buffer.insert(end_iter, f"{sender}: {text}\n\n")
             # Scroll to end
-            mark = self.chat_buffer.create_mark(None, self.chat_buffer.get_end_iter(), False)
-            self.chat_view.scroll_to_mark(mark, 0.0, True, 0.0, 1.0)
+            self.chat_buffer.move_mark(self._end_mark, self.chat_buffer.get_end_iter())
+            self.chat_view.scroll_to_mark(self._end_mark, 0.0, True, 0.0, 1.0)
         except Exception:
             pass
     
@@ -123,14 +137,12 @@ class ChatWindow:
         if response == Gtk.ResponseType.OK:
             filepaths = dialog.get_filenames()
             print(f"Files selected for upload: {filepaths}")
-            for filepath in filepaths:
-                # Run the processing in a background thread for each file
-                thread = threading.Thread(
-                    target=self.app._process_uploaded_file, 
-                    args=(filepath,), 
-                    daemon=True
-                )
-                thread.start()
+            if filepaths:
+                # Process the files in the background, at most four at a time
+                executor = ThreadPoolExecutor(max_workers=min(4, len(filepaths)))
+                for filepath in filepaths:
+                    executor.submit(self.app._process_uploaded_file, filepath, self.app.chat_session_id)
+                executor.shutdown(wait=False)
         
         dialog.destroy()
     
@@ -149,7 +161,7 @@ class ChatWindow:
         from gi.repository import GLib
         GLib.idle_add(self.append_text, "You", text)
         if self.app.chat_session_id:
-            self.app.db.add_message(self.app.chat_session_id, 'user', text)
+            self.app.db.enqueue_message(self.app.chat_session_id, 'user', text)
         
         try:
             self.chat_entry.set_text("")
@@ -168,7 +180,7 @@ class ChatWindow:
                     response_text = result.get('response', '')
                     GLib.idle_add(self.append_text, "Ollama", response_text)
                     if session_id:
-                        self.app.db.add_message(session_id, 'assistant', response_text)
+                        self.app.db.enqueue_message(session_id, 'assistant', response_text)
                 else:
                     error_text = f"Error: {result.get('error')}"
                     GLib.idle_add(self.append_text, "Ollama", error_text)
@@ -184,6 +196,10 @@ class ChatWindow:
     
     def get_analyzer(self):
         """Get or create Ollama analyzer instance."""
+        with self._analyzer_lock:
+            return self._get_analyzer_locked()
+
+    def _get_analyzer_locked(self):
         if not self.ollama_analyzer:
             try:
                 settings = load_user_settings()
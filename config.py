@@ -17,9 +17,15 @@ MIX_SAMPLE_RATE = 48000  # Abtastrate für die gemischte Audiodatei
 HF_TOKEN = os.environ.get("HUGGING_FACE_TOKEN")
 
 # --- User settings persistence ---
+import copy
 import json
 from pathlib import Path
 
+try:
+	import orjson  # optional, faster (de)serialisation of the settings file
+except ImportError:
+	orjson = None
+
 # Use XDG config dir if available, otherwise ~/.config/recass
 _XDG = os.environ.get('XDG_CONFIG_HOME')
 if _XDG:
@@ -30,11 +36,26 @@ else:
 _CONFIG_DIR.mkdir(parents=True, exist_ok=True)
 _SETTINGS_FILE = _CONFIG_DIR / 'user_settings.json'
 
+# Parsed settings and the file mtime they were read at; an external edit changes the mtime
+_SETTINGS_CACHE = None
+_SETTINGS_CACHE_MTIME = None
+
 
 def load_user_settings():
-	"""Load persisted user settings from disk. Returns a dict."""
+	"""Load persisted user settings (cached in-process). Returns a dict the caller may modify."""
+	global _SETTINGS_CACHE, _SETTINGS_CACHE_MTIME
+	mtime = settings_mtime_ns()
+	if _SETTINGS_CACHE is None or mtime != _SETTINGS_CACHE_MTIME:
+		_SETTINGS_CACHE = _read_user_settings()
+		_SETTINGS_CACHE_MTIME = mtime
+	return copy.deepcopy(_SETTINGS_CACHE)
+
+
+def _read_user_settings():
 	try:
 		if _SETTINGS_FILE.exists():
+			if orjson is not None:
+				return orjson.loads(_SETTINGS_FILE.read_bytes())
 			with open(_SETTINGS_FILE, 'r', encoding='utf-8') as f:
 				return json.load(f)
 	except Exception:
@@ -54,11 +75,26 @@ def load_user_settings():
 	}
 
 
+def settings_mtime_ns():
+	"""Return the modification time of the settings file in ns, or None if it does not exist."""
+	try:
+		return _SETTINGS_FILE.stat().st_mtime_ns
+	except OSError:
+		return None
+
+
 def save_user_settings(settings: dict):
 	"""Persist user settings to disk (best-effort)."""
+	global _SETTINGS_CACHE, _SETTINGS_CACHE_MTIME
 	try:
-		with open(_SETTINGS_FILE, 'w', encoding='utf-8') as f:
-			json.dump(settings, f, indent=2)
+		if orjson is not None:
+			_SETTINGS_FILE.write_bytes(orjson.dumps(settings, option=orjson.OPT_INDENT_2))
+		else:
+			with open(_SETTINGS_FILE, 'w', encoding='utf-8') as f:
+				# dumps + single write avoids json.dump's many small writes
+				f.write(json.dumps(settings, indent=2, ensure_ascii=False))
+		_SETTINGS_CACHE = copy.deepcopy(settings)
+		_SETTINGS_CACHE_MTIME = settings_mtime_ns()
 		return True
 	except Exception:
 		return False
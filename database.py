@@ -1,7 +1,70 @@
+import queue
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
 from datetime import datetime
 import json
+from functools import lru_cache
+
+
+# Hot query shapes, kept as constants so sqlite3's statement cache reuses the prepared form
+_SEARCH_CHATS_FTS_SQL = """
+    SELECT id FROM chats
+    WHERE title LIKE ? ESCAPE '\\'
+       OR id IN (SELECT session_id FROM chat_messages_fts WHERE chat_messages_fts MATCH ?)
+"""
+_SEARCH_CHATS_LIKE_SQL = """
+    SELECT id FROM chats
+    WHERE title LIKE ? ESCAPE '\\'
+       OR id IN (SELECT session_id FROM messages WHERE content LIKE ? ESCAPE '\\')
+"""
+_UPDATE_MEETING_SQL = """
+    UPDATE meetings SET
+        title = COALESCE(?, title),
+        duration = COALESCE(?, duration),
+        attendees = COALESCE(?, attendees),
+        status = COALESCE(?, status),
+        transcript = COALESCE(?, transcript),
+        analysis = COALESCE(?, analysis)
+    WHERE folder_name = ?
+"""
+_CHAT_SESSIONS_WITH_STATS_SQL = """
+    SELECT c.*, COALESCE(s.msg_count, 0) AS msg_count, s.last_message_at, s.last_snippet
+    FROM chats c
+    LEFT JOIN chat_session_stats s ON s.session_id = c.id
+    ORDER BY c.created_at DESC
+"""
+
+
+@lru_cache(maxsize=4096)
+def _format_timestamp(iso_string: str, fmt: str) -> str:
+    """Formats an ISO timestamp for display; cached since rows are re-rendered often. Returns "" if unparsable."""
+    try:
+        return datetime.fromisoformat(iso_string).strftime(fmt)
+    except (ValueError, TypeError):
+        return ""
+
+
+def _escape_like(text: str) -> str:
+    """Escapes LIKE wildcards so that text is matched literally (ESCAPE '\\')."""
+    return text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _fts_prefix_query(text: str) -> str:
+    """Builds an FTS5 query that matches every word of text as a quoted prefix."""
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in text.split())
+
+
+def _prefix_upper_bound(prefix: str) -> str:
+    """Returns the smallest string greater than every string starting with prefix."""
+    return prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
+def _fts_column_query(columns, text: str) -> str:
+    """Restricts an FTS5 prefix query for text to the given columns."""
+    return "{" + " ".join(columns) + "} : (" + _fts_prefix_query(text) + ")"
+
 
 class Database:
     """Handles all database operations for chat sessions and messages."""
@@ -15,11 +78,33 @@ class Database:
         """
         self.db_file = db_file
         self.conn = None
+        self.has_chat_fts = False
+        self.has_meeting_fts = False
+        # Bumped on every chat/message write so callers can invalidate cached chat lists
+        self.sessions_epoch = 0
+        # Same for meeting writes (cached meeting lists in the meeting browser)
+        self.meetings_epoch = 0
+        # Messages from enqueue_message(), written in batches by a background thread
+        self._message_queue = queue.Queue()
+        self._writer_thread = None
+        # The connection is shared by the GTK thread, workers and the message writer;
+        # chat writes hold this lock so their transactions do not interleave
+        self._write_lock = threading.Lock()
         try:
-            self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+            self.conn = sqlite3.connect(self.db_file, check_same_thread=False, cached_statements=512)
             self.conn.row_factory = sqlite3.Row
             # Enable foreign key support
             self.conn.execute("PRAGMA foreign_keys = ON")
+            # WAL lets UI reads proceed while the message writer commits; NORMAL sync is
+            # durable across application crashes, which is what a desktop app needs
+            if self.db_file != ":memory:":
+                mode = self.conn.execute("PRAGMA journal_mode = WAL").fetchone()[0]
+                if mode != "wal":
+                    print(f"Database could not switch to WAL mode, using '{mode}'")
+            self.conn.execute("PRAGMA synchronous = NORMAL")
+            self.conn.execute("PRAGMA temp_store = MEMORY")
+            self.conn.execute("PRAGMA cache_size = -65536")  # 64 MiB page cache
+            self.conn.execute("PRAGMA mmap_size = 268435456")  # 256 MiB memory-mapped reads
             self.create_tables()
         except sqlite3.Error as e:
             print(f"Database error: {e}")
@@ -41,7 +126,7 @@ class Database:
             cursor.execute("SELECT version FROM schema_version WHERE id = 1")
             result = cursor.fetchone()
             if result is None:
-                cursor.execute("INSERT INTO schema_version (id, version) VALUES (1, 3)") # Bump version for new schema
+                cursor.execute("INSERT INTO schema_version (id, version) VALUES (1, 7)") # Bump version for new schema
             
             # Update to version 2 (already handled)
             if result and result['version'] < 2:
@@ -75,6 +160,61 @@ class Database:
                 """)
                 cursor.execute("UPDATE schema_version SET version = 3 WHERE id = 1")
 
+            # Meetings table (for fresh dbs; older ones got it in the version 3 migration)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS meetings (
+                    id TEXT PRIMARY KEY,
+                    folder_name TEXT NOT NULL UNIQUE,
+                    title TEXT,
+                    created_at TEXT NOT NULL,
+                    duration INTEGER,
+                    attendees TEXT,
+                    status TEXT,
+                    transcript TEXT,
+                    analysis TEXT
+                )
+            """)
+
+            # Index-backed ordering for the meeting list and status/date filters
+            cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'index' AND name = 'idx_meetings_status_created'")
+            new_meeting_indexes = cursor.fetchone() is None
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_created_at ON meetings (created_at DESC)")
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_meetings_status_created ON meetings (status, created_at DESC)")
+
+            # Full-text index over meetings, an external-content table synced by triggers (version 6)
+            try:
+                cursor.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS meetings_fts
+                    USING fts5(title, transcript, analysis, attendees,
+                               content='meetings', content_rowid='rowid', tokenize='porter unicode61')
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS meetings_fts_insert AFTER INSERT ON meetings BEGIN
+                        INSERT INTO meetings_fts (rowid, title, transcript, analysis, attendees)
+                        VALUES (new.rowid, new.title, new.transcript, new.analysis, new.attendees);
+                    END
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS meetings_fts_delete AFTER DELETE ON meetings BEGIN
+                        INSERT INTO meetings_fts (meetings_fts, rowid, title, transcript, analysis, attendees)
+                        VALUES ('delete', old.rowid, old.title, old.transcript, old.analysis, old.attendees);
+                    END
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS meetings_fts_update AFTER UPDATE ON meetings BEGIN
+                        INSERT INTO meetings_fts (meetings_fts, rowid, title, transcript, analysis, attendees)
+                        VALUES ('delete', old.rowid, old.title, old.transcript, old.analysis, old.attendees);
+                        INSERT INTO meetings_fts (rowid, title, transcript, analysis, attendees)
+                        VALUES (new.rowid, new.title, new.transcript, new.analysis, new.attendees);
+                    END
+                """)
+                if result and result['version'] < 6:
+                    cursor.execute("INSERT INTO meetings_fts (meetings_fts) VALUES ('rebuild')")
+                self.has_meeting_fts = True
+            except sqlite3.OperationalError as e:
+                print(f"Meeting full-text search unavailable: {e}")
+                self.has_meeting_fts = False
+
             # Chats table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS chats (
@@ -83,6 +223,7 @@ class Database:
                     created_at TEXT NOT NULL
                 )
             """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_chats_created ON chats (created_at DESC)")
 
             # Messages table
             cursor.execute("""
@@ -95,7 +236,78 @@ class Database:
                     FOREIGN KEY (session_id) REFERENCES chats (id) ON DELETE CASCADE
                 )
             """)
+            cursor.execute("CREATE INDEX IF NOT EXISTS idx_messages_session_created ON messages (session_id, created_at)")
             
+            # Full-text index over chat messages, kept in sync by triggers (version 4)
+            try:
+                cursor.execute("""
+                    CREATE VIRTUAL TABLE IF NOT EXISTS chat_messages_fts
+                    USING fts5(content, session_id UNINDEXED)
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS messages_fts_insert AFTER INSERT ON messages BEGIN
+                        INSERT INTO chat_messages_fts (rowid, content, session_id)
+                        VALUES (new.rowid, new.content, new.session_id);
+                    END
+                """)
+                cursor.execute("""
+                    CREATE TRIGGER IF NOT EXISTS messages_fts_delete AFTER DELETE ON messages BEGIN
+                        DELETE FROM chat_messages_fts WHERE rowid = old.rowid;
+                    END
+                """)
+                if result and result['version'] < 4:
+                    cursor.execute("""
+                        INSERT INTO chat_messages_fts (rowid, content, session_id)
+                        SELECT rowid, content, session_id FROM messages
+                    """)
+                    cursor.execute("UPDATE schema_version SET version = 4 WHERE id = 1")
+                self.has_chat_fts = True
+            except sqlite3.OperationalError as e:
+                # SQLite built without FTS5; chat search falls back to LIKE
+                print(f"Chat full-text search unavailable: {e}")
+                self.has_chat_fts = False
+
+            # Per-chat message count and latest message, kept up to date by triggers (version 5)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS chat_session_stats (
+                    session_id TEXT PRIMARY KEY,
+                    msg_count INTEGER NOT NULL DEFAULT 0,
+                    last_message_at TEXT,
+                    last_snippet TEXT,
+                    FOREIGN KEY (session_id) REFERENCES chats (id) ON DELETE CASCADE
+                )
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_stats_insert AFTER INSERT ON messages BEGIN
+                    INSERT INTO chat_session_stats (session_id, msg_count, last_message_at, last_snippet)
+                    VALUES (new.session_id, 1, new.created_at, substr(new.content, 1, 120))
+                    ON CONFLICT (session_id) DO UPDATE SET
+                        msg_count = msg_count + 1,
+                        last_message_at = excluded.last_message_at,
+                        last_snippet = excluded.last_snippet;
+                END
+            """)
+            cursor.execute("""
+                CREATE TRIGGER IF NOT EXISTS messages_stats_delete AFTER DELETE ON messages BEGIN
+                    UPDATE chat_session_stats SET msg_count = msg_count - 1
+                    WHERE session_id = old.session_id;
+                END
+            """)
+            if result and result['version'] < 5:
+                cursor.execute("""
+                    INSERT OR REPLACE INTO chat_session_stats (session_id, msg_count, last_message_at, last_snippet)
+                    SELECT m.session_id, COUNT(*), MAX(m.created_at),
+                           (SELECT substr(content, 1, 120) FROM messages
+                            WHERE session_id = m.session_id
+                            ORDER BY created_at DESC, rowid DESC LIMIT 1)
+                    FROM messages m
+                    GROUP BY m.session_id
+                """)
+                # Stays below 5 if the FTS migration to 4 could not run on this SQLite build
+                cursor.execute("UPDATE schema_version SET version = 5 WHERE id = 1 AND version = 4")
+            if self.has_meeting_fts:
+                cursor.execute("UPDATE schema_version SET version = 6 WHERE id = 1 AND version = 5")
+
             # Indexed files table (for fresh dbs and previous version)
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS indexed_files (
@@ -107,6 +319,39 @@ class Database:
                 )
             """)
 
+            # Chroma chunk ids per indexed file (version 7; replaces the chunk_ids JSON column)
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS file_chunks (
+                    filepath TEXT NOT NULL REFERENCES indexed_files (filepath) ON DELETE CASCADE,
+                    chunk_id TEXT NOT NULL,
+                    PRIMARY KEY (filepath, chunk_id)
+                )
+            """)
+            if result and result['version'] < 7:
+                cursor.execute("SELECT filepath, chunk_ids FROM indexed_files WHERE chunk_ids IS NOT NULL")
+                rows = [(row['filepath'], chunk_id)
+                        for row in cursor.fetchall()
+                        for chunk_id in json.loads(row['chunk_ids'])]
+                cursor.executemany("INSERT OR IGNORE INTO file_chunks (filepath, chunk_id) VALUES (?, ?)", rows)
+                cursor.execute("UPDATE indexed_files SET chunk_ids = NULL")
+                cursor.execute("UPDATE schema_version SET version = 7 WHERE id = 1 AND version = 6")
+
+            # Content hashes of files uploaded through the chat window, per chat session
+            cursor.execute("DROP TABLE IF EXISTS uploaded_files")  # Unscoped predecessor
+            cursor.execute("""
+                CREATE TABLE IF NOT EXISTS session_uploads (
+                    session_id TEXT NOT NULL REFERENCES chats (id) ON DELETE CASCADE,
+                    file_hash TEXT NOT NULL,
+                    filename TEXT NOT NULL,
+                    uploaded_at TEXT NOT NULL,
+                    PRIMARY KEY (session_id, file_hash)
+                )
+            """)
+
+            if new_meeting_indexes:
+                # Gather statistics once so the planner considers the new indexes
+                cursor.execute("ANALYZE")
+
             self.conn.commit()
             print("Database tables checked/created successfully.")
         except sqlite3.Error as e:
@@ -115,24 +360,62 @@ class Database:
     def get_indexed_file(self, filepath: str):
         """Retrieves indexing information for a single file."""
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM indexed_files WHERE filepath = ?", (filepath,))
-            row = cursor.fetchone()
-            return dict(row) if row else None
+            return self.conn.execute("SELECT * FROM indexed_files WHERE filepath = ?", (filepath,)).fetchone()
         except sqlite3.Error as e:
             print(f"Error getting indexed file {filepath}: {e}")
             return None
             
-    def update_indexed_file(self, filepath: str, size: int, modified_time: float, file_hash: str, chunk_ids: list):
-        """Inserts or updates the indexing information for a file."""
+    def commit(self):
+        """Commits writes made with commit=False."""
+        try:
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error committing: {e}")
+
+    @contextmanager
+    def write_batch(self):
+        """
+        Holds the write lock around several commit=False writes and commits them together.
+
+        The connection is shared with the GTK thread and the chat writer; taking the lock
+        keeps their `with self.conn:` blocks from committing or rolling back half a batch.
+        """
+        with self._write_lock:
+            try:
+                yield
+            finally:
+                self.commit()
+
+    def update_indexed_file(self, filepath: str, size: int, modified_time: float, file_hash: str, chunk_ids: list, commit: bool = True):
+        """Inserts or updates the indexing information for a file. Pass commit=False to batch writes."""
         try:
             cursor = self.conn.cursor()
-            chunk_ids_json = json.dumps(chunk_ids)
             cursor.execute("""
-                INSERT OR REPLACE INTO indexed_files (filepath, size, modified_time, file_hash, chunk_ids)
-                VALUES (?, ?, ?, ?, ?)
-            """, (filepath, size, modified_time, file_hash, chunk_ids_json))
-            self.conn.commit()
+                INSERT INTO indexed_files (filepath, size, modified_time, file_hash)
+                VALUES (?, ?, ?, ?)
+                ON CONFLICT (filepath) DO UPDATE SET
+                    size = excluded.size,
+                    modified_time = excluded.modified_time,
+                    file_hash = excluded.file_hash
+            """, (filepath, size, modified_time, file_hash))
+            cursor.execute("DELETE FROM file_chunks WHERE filepath = ?", (filepath,))
+            cursor.executemany(
+                "INSERT INTO file_chunks (filepath, chunk_id) VALUES (?, ?)",
+                [(filepath, chunk_id) for chunk_id in chunk_ids]
+            )
+            if commit:
+                self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error updating indexed file {filepath}: {e}")
+
+    def touch_indexed_file(self, filepath: str, size: int, modified_time: float, commit: bool = True):
+        """Updates size and mtime of an indexed file whose contents did not change."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("UPDATE indexed_files SET size = ?, modified_time = ? WHERE filepath = ?",
+                           (size, modified_time, filepath))
+            if commit:
+                self.conn.commit()
         except sqlite3.Error as e:
             print(f"Error updating indexed file {filepath}: {e}")
 
@@ -144,18 +427,114 @@ class Database:
             self.conn.commit()
         except sqlite3.Error as e:
             print(f"Error deleting indexed file {filepath}: {e}")
+
+    def delete_indexed_files(self, filepaths, commit: bool = True):
+        """Deletes indexing information for several files in one statement batch."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.executemany("DELETE FROM indexed_files WHERE filepath = ?", [(p,) for p in filepaths])
+            if commit:
+                self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error deleting indexed files: {e}")
             
+    def get_indexed_files_meta_by_folder(self, folder_path: str):
+        """Like get_indexed_files_by_folder, but only with the columns needed to detect changes."""
+        try:
+            cursor = self.conn.cursor()
+            if folder_path:
+                cursor.execute("""
+                    SELECT filepath, size, modified_time, file_hash FROM indexed_files
+                    WHERE filepath >= ? AND filepath < ?
+                """, (folder_path, _prefix_upper_bound(folder_path)))
+            else:
+                cursor.execute("SELECT filepath, size, modified_time, file_hash FROM indexed_files")
+            return {row['filepath']: row for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            print(f"Error getting indexed files for folder {folder_path}: {e}")
+            return {}
+
     def get_indexed_files_by_folder(self, folder_path: str):
         """Retrieves all indexed files within a given folder path."""
         try:
             cursor = self.conn.cursor()
-            # Use LIKE to find all files starting with the folder path
-            cursor.execute("SELECT * FROM indexed_files WHERE filepath LIKE ?", (folder_path + '%',))
-            return {row['filepath']: dict(row) for row in cursor.fetchall()}
+            # Prefix match as a range on the primary key index; LIKE would scan the table
+            if folder_path:
+                cursor.execute("SELECT * FROM indexed_files WHERE filepath >= ? AND filepath < ?",
+                               (folder_path, _prefix_upper_bound(folder_path)))
+            else:
+                cursor.execute("SELECT * FROM indexed_files")
+            return {row['filepath']: row for row in cursor.fetchall()}
         except sqlite3.Error as e:
             print(f"Error getting indexed files for folder {folder_path}: {e}")
             return {}
 
+    def claim_uploaded_file(self, session_id: str, file_hash: str, filename: str) -> bool:
+        """
+        Records an uploaded file by content hash unless it was uploaded to this chat session before.
+
+        Args:
+            session_id (str): The chat session the file is uploaded to.
+            file_hash (str): SHA-256 hex digest of the file contents.
+            filename (str): The file's base name, for reference.
+
+        Returns:
+            bool: True if the hash was new and the caller should index the file.
+        """
+        uploaded_at = datetime.now().isoformat()
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(
+                "INSERT OR IGNORE INTO session_uploads (session_id, file_hash, filename, uploaded_at) VALUES (?, ?, ?, ?)",
+                (session_id, file_hash, filename, uploaded_at)
+            )
+            self.conn.commit()
+            return cursor.rowcount == 1
+        except sqlite3.Error as e:
+            print(f"Error recording uploaded file {filename}: {e}")
+            return True
+
+    def release_uploaded_file(self, session_id: str, file_hash: str):
+        """Forgets an uploaded file hash of a chat session, e.g. after indexing it failed."""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("DELETE FROM session_uploads WHERE session_id = ? AND file_hash = ?", (session_id, file_hash))
+            self.conn.commit()
+        except sqlite3.Error as e:
+            print(f"Error removing uploaded file {file_hash}: {e}")
+
+    def get_chunk_ids_for_files(self, filepaths):
+        """Returns the Chroma chunk ids stored for the given files."""
+        filepaths = list(filepaths)
+        chunk_ids = []
+        try:
+            cursor = self.conn.cursor()
+            # Stay well below SQLite's bound-parameter limit
+            for i in range(0, len(filepaths), 500):
+                batch = filepaths[i:i + 500]
+                cursor.execute(
+                    f"SELECT chunk_id FROM file_chunks WHERE filepath IN ({', '.join('?' * len(batch))})",
+                    batch
+                )
+                chunk_ids.extend(row['chunk_id'] for row in cursor.fetchall())
+        except sqlite3.Error as e:
+            print(f"Error getting chunk ids: {e}")
+        return chunk_ids
+
+    def get_chunk_ids_by_folder(self, folder_path: str):
+        """Returns the Chroma chunk ids of all indexed files within a folder path."""
+        try:
+            cursor = self.conn.cursor()
+            if folder_path:
+                cursor.execute("SELECT chunk_id FROM file_chunks WHERE filepath >= ? AND filepath < ?",
+                               (folder_path, _prefix_upper_bound(folder_path)))
+            else:
+                cursor.execute("SELECT chunk_id FROM file_chunks")
+            return [row['chunk_id'] for row in cursor.fetchall()]
+        except sqlite3.Error as e:
+            print(f"Error getting chunk ids for folder {folder_path}: {e}")
+            return []
+
     def create_chat_session(self, title: str) -> str:
         """
         Creates a new chat session.
@@ -169,12 +548,14 @@ class Database:
         session_id = str(uuid.uuid4())
         created_at = datetime.now().isoformat()
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO chats (id, title, created_at) VALUES (?, ?, ?)",
-                (session_id, title, created_at)
-            )
-            self.conn.commit()
+            with self._write_lock:
+                cursor = self.conn.cursor()
+                cursor.execute(
+                    "INSERT INTO chats (id, title, created_at) VALUES (?, ?, ?)",
+                    (session_id, title, created_at)
+                )
+                self.conn.commit()
+            self.sessions_epoch += 1
             return session_id
         except sqlite3.Error as e:
             print(f"Error creating chat session: {e}")
@@ -192,36 +573,160 @@ class Database:
         Returns:
             str: The ID of the newly created message.
         """
-        message_id = str(uuid.uuid4())
-        created_at = datetime.now().isoformat()
+        message_ids = self.add_messages(session_id, [(role, content)])
+        return message_ids[0] if message_ids else None
+
+    def add_messages(self, session_id: str, items) -> list:
+        """
+        Adds several messages to a chat session in a single transaction.
+
+        Callers producing many small messages (e.g. streamed tokens) should
+        buffer them and flush through this method instead of add_message.
+
+        Args:
+            session_id (str): The ID of the chat session.
+            items: Iterable of (role, content) tuples, oldest first.
+
+        Returns:
+            list: The IDs of the new messages, or an empty list on error.
+        """
+        rows = [(str(uuid.uuid4()), session_id, role, content, datetime.now().isoformat())
+                for role, content in items]
         try:
-            cursor = self.conn.cursor()
-            cursor.execute(
-                "INSERT INTO messages (id, session_id, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
-                (message_id, session_id, role, content, created_at)
-            )
-            self.conn.commit()
-            return message_id
+            with self._write_lock, self.conn:
+                self.conn.executemany(
+                    "INSERT INTO messages (id, session_id, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+            self.sessions_epoch += 1
+            return [row[0] for row in rows]
         except sqlite3.Error as e:
-            print(f"Error adding message: {e}")
-            return None
+            print(f"Error adding messages: {e}")
+            return []
+
+    def enqueue_message(self, session_id: str, role: str, content: str) -> str:
+        """
+        Queues a message for a chat session without waiting for the write.
+
+        The message is stored by a background thread, batched with other queued
+        messages into a single transaction.
+
+        Args:
+            session_id (str): The ID of the chat session.
+            role (str): The role of the message sender (e.g., 'user', 'assistant').
+            content (str): The content of the message.
+
+        Returns:
+            str: The ID the message will be stored under.
+        """
+        message_id = str(uuid.uuid4())
+        created_at = datetime.now().isoformat()
+        if self._writer_thread is None:
+            self._writer_thread = threading.Thread(target=self._message_writer_loop, daemon=True)
+            self._writer_thread.start()
+        self._message_queue.put((message_id, session_id, role, content, created_at))
+        return message_id
+
+    def _message_writer_loop(self, max_batch=32, max_wait=0.05):
+        """Drains the message queue, inserting up to max_batch messages per transaction."""
+        while True:
+            item = self._message_queue.get()
+            if item is None:
+                return
+            batch = [item]
+            stop = False
+            try:
+                while len(batch) < max_batch:
+                    item = self._message_queue.get(timeout=max_wait)
+                    if item is None:
+                        stop = True
+                        break
+                    batch.append(item)
+            except queue.Empty:
+                pass
+
+            try:
+                with self._write_lock, self.conn:
+                    self.conn.executemany(
+                        "INSERT INTO messages (id, session_id, role, content, created_at) VALUES (?, ?, ?, ?, ?)",
+                        batch
+                    )
+                self.sessions_epoch += 1
+            except sqlite3.Error as e:
+                print(f"Error writing queued messages: {e}")
+            if stop:
+                return
+
+    def flush_message_queue(self):
+        """Writes all queued messages and stops the writer thread."""
+        if self._writer_thread is not None:
+            self._message_queue.put(None)
+            self._writer_thread.join()
+            self._writer_thread = None
 
     def get_chat_sessions(self):
         """
         Retrieves all chat sessions, ordered by creation date.
 
         Returns:
-            list: A list of dictionaries representing chat sessions.
+            list: A list of dictionaries representing chat sessions, each with a
+                display-ready `_formatted_date`.
         """
         try:
             cursor = self.conn.cursor()
             cursor.execute("SELECT * FROM chats ORDER BY created_at DESC")
             sessions = [dict(row) for row in cursor.fetchall()]
+            for session in sessions:
+                session['_formatted_date'] = _format_timestamp(session['created_at'], "%Y-%m-%d %H:%M") or "Unknown Date"
             return sessions
         except sqlite3.Error as e:
             print(f"Error getting chat sessions: {e}")
             return []
 
+    def get_chat_sessions_with_stats(self):
+        """
+        Retrieves all chat sessions with their message statistics in one query.
+
+        Returns:
+            list: Like get_chat_sessions(), with `msg_count`, `last_message_at` and
+                `last_snippet` (the first 120 characters of the newest message) added.
+        """
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute(_CHAT_SESSIONS_WITH_STATS_SQL)
+            sessions = [dict(row) for row in cursor.fetchall()]
+            for session in sessions:
+                session['_formatted_date'] = _format_timestamp(session['created_at'], "%Y-%m-%d %H:%M") or "Unknown Date"
+            return sessions
+        except sqlite3.Error as e:
+            print(f"Error getting chat sessions with stats: {e}")
+            return []
+
+    def search_chat_sessions(self, query: str):
+        """
+        Finds chat sessions whose title or any message matches the query.
+
+        Title matches are substring matches; messages are searched through the
+        full-text index, matching every word of the query as a prefix.
+
+        Args:
+            query (str): The search text.
+
+        Returns:
+            set: The IDs of the matching chat sessions.
+        """
+        title_pattern = "%" + _escape_like(query) + "%"
+        try:
+            cursor = self.conn.cursor()
+            if self.has_chat_fts:
+                cursor.execute(_SEARCH_CHATS_FTS_SQL, (title_pattern, _fts_prefix_query(query)))
+            else:
+                cursor.execute(_SEARCH_CHATS_LIKE_SQL, (title_pattern, title_pattern))
+            return {row['id'] for row in cursor.fetchall()}
+        except sqlite3.Error as e:
+            print(f"Error searching chat sessions: {e}")
+            return set()
+
     def get_chat_session(self, session_id: str):
         """
         Retrieves a single chat session by its ID.
@@ -230,34 +735,44 @@ class Database:
             session_id (str): The ID of the chat session.
 
         Returns:
-            dict: A dictionary representing the chat session, or None if not found.
+            sqlite3.Row: The chat session, or None if not found.
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM chats WHERE id = ?", (session_id,))
-            session = cursor.fetchone()
-            return dict(session) if session else None
+            return self.conn.execute("SELECT * FROM chats WHERE id = ?", (session_id,)).fetchone()
         except sqlite3.Error as e:
             print(f"Error getting chat session: {e}")
             return None
 
-    def get_messages_for_session(self, session_id: str):
+    def get_messages_for_session(self, session_id: str, limit: int = None, before: tuple = None):
         """
-        Retrieves all messages for a given session, ordered by creation date.
+        Retrieves messages for a given session, ordered by creation date.
 
         Args:
             session_id (str): The ID of the chat session.
+            limit (int): If set, only the newest `limit` matching messages are returned.
+            before (tuple): Optional (created_at, rowid) of the oldest message already
+                loaded; only older messages are returned.
 
         Returns:
-            list: A list of dictionaries representing messages.
+            list: A list of dictionaries representing messages, oldest first. Each
+                includes its `rowid` for use in the `before` cursor of the next page
+                and a display-ready `_formatted_time`.
         """
+        query = "SELECT rowid, * FROM messages WHERE session_id = ?"
+        params = [session_id]
+        if before is not None:
+            query += " AND (created_at, rowid) < (?, ?)"
+            params.extend(before)
+        query += " ORDER BY created_at DESC, rowid DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
         try:
             cursor = self.conn.cursor()
-            cursor.execute(
-                "SELECT * FROM messages WHERE session_id = ? ORDER BY created_at ASC",
-                (session_id,)
-            )
-            messages = [dict(row) for row in cursor.fetchall()]
+            cursor.execute(query, params)
+            messages = [dict(row) for row in reversed(cursor.fetchall())]
+            for message in messages:
+                message['_formatted_time'] = _format_timestamp(message['created_at'], "%Y-%m-%d %H:%M:%S") or "Unknown Time"
             return messages
         except sqlite3.Error as e:
             print(f"Error getting messages for session: {e}")
@@ -291,6 +806,7 @@ class Database:
                 (meeting_id, folder_name, title, created_at, duration, attendees, status, transcript, analysis)
             )
             self.conn.commit()
+            self.meetings_epoch += 1
             return meeting_id
         except sqlite3.Error as e:
             print(f"Error creating meeting: {e}")
@@ -309,36 +825,16 @@ class Database:
             transcript (str): The new full transcript text of the meeting.
             analysis (str): The new AI analysis summary of the meeting.
         """
-        updates = []
-        params = []
-        if title is not None:
-            updates.append("title = ?")
-            params.append(title)
-        if duration is not None:
-            updates.append("duration = ?")
-            params.append(duration)
-        if attendees is not None:
-            updates.append("attendees = ?")
-            params.append(attendees)
-        if status is not None:
-            updates.append("status = ?")
-            params.append(status)
-        if transcript is not None:
-            updates.append("transcript = ?")
-            params.append(transcript)
-        if analysis is not None:
-            updates.append("analysis = ?")
-            params.append(analysis)
-
-        if not updates:
+        params = (title, duration, attendees, status, transcript, analysis)
+        if all(value is None for value in params):
             return # Nothing to update
 
-        query = f"UPDATE meetings SET {', '.join(updates)} WHERE folder_name = ?"
-        params.append(folder_name)
         try:
             cursor = self.conn.cursor()
-            cursor.execute(query, tuple(params))
+            # None keeps the current value; one fixed statement text stays in the statement cache
+            cursor.execute(_UPDATE_MEETING_SQL, params + (folder_name,))
             self.conn.commit()
+            self.meetings_epoch += 1
         except sqlite3.Error as e:
             print(f"Error updating meeting {folder_name}: {e}")
 
@@ -350,13 +846,10 @@ class Database:
             folder_name (str): The folder name of the meeting.
 
         Returns:
-            dict: A dictionary representing the meeting, or None if not found.
+            sqlite3.Row: The meeting record, or None if not found.
         """
         try:
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT * FROM meetings WHERE folder_name = ?", (folder_name,))
-            meeting = cursor.fetchone()
-            return dict(meeting) if meeting else None
+            return self.conn.execute("SELECT * FROM meetings WHERE folder_name = ?", (folder_name,)).fetchone()
         except sqlite3.Error as e:
             print(f"Error getting meeting by folder {folder_name}: {e}")
             return None
@@ -366,12 +859,12 @@ class Database:
         Retrieves all meeting records, ordered by creation date.
 
         Returns:
-            list: A list of dictionaries representing meeting records.
+            list: sqlite3.Row objects representing meeting records.
         """
         try:
             cursor = self.conn.cursor()
             cursor.execute("SELECT * FROM meetings ORDER BY created_at DESC")
-            meetings = [dict(row) for row in cursor.fetchall()]
+            meetings = cursor.fetchall()
             return meetings
         except sqlite3.Error as e:
             print(f"Error getting all meetings: {e}")
@@ -389,7 +882,7 @@ class Database:
             attendees (str): An attendee to search for in the title, transcript, and analysis.
 
         Returns:
-            list: A list of dictionaries representing matching meeting records.
+            list: sqlite3.Row objects representing matching meeting records.
         """
         try:
             cursor = self.conn.cursor()
@@ -409,15 +902,26 @@ class Database:
                 conditions.append("created_at <= ?")
                 params.append(end_date)
             
-            if topic:
-                conditions.append("(title LIKE ? OR transcript LIKE ? OR analysis LIKE ?)")
-                term = f"%{topic}%"
-                params.extend([term, term, term])
-            
-            if attendees:
-                conditions.append("(title LIKE ? OR transcript LIKE ? OR analysis LIKE ?)")
-                term = f"%{attendees}%"
-                params.extend([term, term, term])
+            if self.has_meeting_fts:
+                # Topic and attendee terms share one MATCH, so the index is searched once
+                match_terms = []
+                if topic:
+                    match_terms.append(_fts_column_query(("title", "transcript", "analysis"), topic))
+                if attendees:
+                    match_terms.append(_fts_column_query(("title", "transcript", "analysis", "attendees"), attendees))
+                if match_terms:
+                    conditions.append("rowid IN (SELECT rowid FROM meetings_fts WHERE meetings_fts MATCH ?)")
+                    params.append(" AND ".join(match_terms))
+            else:
+                if topic:
+                    conditions.append("(title LIKE ? OR transcript LIKE ? OR analysis LIKE ?)")
+                    term = f"%{topic}%"
+                    params.extend([term, term, term])
+
+                if attendees and attendees != topic:
+                    conditions.append("(title LIKE ? OR transcript LIKE ? OR analysis LIKE ?)")
+                    term = f"%{attendees}%"
+                    params.extend([term, term, term])
 
             if conditions:
                 query += " WHERE " + " AND ".join(conditions)
@@ -425,7 +929,7 @@ class Database:
             query += " ORDER BY created_at DESC"
 
             cursor.execute(query, tuple(params))
-            meetings = [dict(row) for row in cursor.fetchall()]
+            meetings = cursor.fetchall()
             return meetings
         except sqlite3.Error as e:
             print(f"Error filtering meetings: {e}")
@@ -435,21 +939,32 @@ class Database:
         """
         Searches for meetings where the query appears in the title, transcript, or analysis.
 
+        Uses the full-text index when available, matching every word of the
+        query as a prefix (with stemming); otherwise falls back to substring matching.
+
         Args:
             query (str): The search term.
 
         Returns:
-            list: A list of dictionaries representing matching meeting records.
+            list: sqlite3.Row objects representing matching meeting records.
         """
         try:
             cursor = self.conn.cursor()
-            search_query = f"%{query}%"
-            cursor.execute("""
-                SELECT * FROM meetings
-                WHERE title LIKE ? OR transcript LIKE ? OR analysis LIKE ?
-                ORDER BY created_at DESC
-            """, (search_query, search_query, search_query))
-            meetings = [dict(row) for row in cursor.fetchall()]
+            if self.has_meeting_fts:
+                cursor.execute("""
+                    SELECT m.* FROM meetings m
+                    JOIN meetings_fts f ON f.rowid = m.rowid
+                    WHERE meetings_fts MATCH ?
+                    ORDER BY m.created_at DESC
+                """, (_fts_prefix_query(query),))
+            else:
+                search_query = f"%{query}%"
+                cursor.execute("""
+                    SELECT * FROM meetings
+                    WHERE title LIKE ? OR transcript LIKE ? OR analysis LIKE ?
+                    ORDER BY created_at DESC
+                """, (search_query, search_query, search_query))
+            meetings = cursor.fetchall()
             return meetings
         except sqlite3.Error as e:
             print(f"Error searching meetings: {e}")
@@ -457,6 +972,7 @@ class Database:
 
     def close(self):
         """Closes the database connection."""
+        self.flush_message_queue()
         if self.conn:
             self.conn.close()
             self.conn = None
@@ -493,10 +1009,10 @@ if __name__ == '__main__':
     print("\n--- Testing indexed_files ---")
     db.update_indexed_file("/path/to/file.txt", 1024, 1678886400.0, "hash123", ["chunk1", "chunk2"])
     file_info = db.get_indexed_file("/path/to/file.txt")
-    print("Retrieved file info:", file_info)
+    print("Retrieved file info:", dict(file_info))
     
     folder_files = db.get_indexed_files_by_folder("/path/to/")
-    print("Files in folder:", folder_files)
+    print("Files in folder:", {path: dict(row) for path, row in folder_files.items()})
 
     db.delete_indexed_file("/path/to/file.txt")
     print("File info deleted.")
@@ -520,11 +1036,11 @@ if __name__ == '__main__':
     meetings = db.get_all_meetings()
     print("\nAll meetings:")
     for meeting in meetings:
-        print(meeting)
+        print(dict(meeting))
 
     updated_title = "Revised Project Alpha Kickoff"
     db.update_meeting(folder_name="meeting-2023-10-26-09-00-00", title=updated_title)
     updated_meeting = db.get_meeting_by_folder("meeting-2023-10-26-09-00-00")
-    print("\nUpdated meeting:", updated_meeting)
+    print("\nUpdated meeting:", dict(updated_meeting))
 
     db.close()
@@ -1,194 +1,340 @@
 import os
-import json
+import io
 import hashlib
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from bs4 import BeautifulSoup
 import docx
 import openpyxl
 from PyPDF2 import PdfReader
 
+try:
+    import pypdfium2 as pdfium  # PDFium bindings, much faster text extraction than PyPDF2
+except ImportError:
+    pdfium = None
+
+# Worker threads for hashing and text extraction. Threads rather than processes: the
+# app holds GTK/PortAudio/torch threads (unsafe to fork) and spawning would re-import
+# main.py with torch and whisper in every worker. hashlib and file reads release the GIL.
+INDEX_WORKERS = min(8, os.cpu_count() or 1)
+
+
+# Extractors take the file's bytes, which were already read for hashing
+def _extract_plain(data):
+    return data.decode('utf-8')
+
+
+def _extract_html(data):
+    soup = BeautifulSoup(data.decode('utf-8'), 'html.parser')
+    return soup.get_text(separator='\n', strip=True)
+
+
+def _extract_docx(data):
+    doc = docx.Document(io.BytesIO(data))
+    return '\n'.join([para.text for para in doc.paragraphs])
+
+
+def _extract_xlsx(data):
+    workbook = openpyxl.load_workbook(io.BytesIO(data), read_only=True)
+    try:
+        full_text = []
+        for sheet in workbook.worksheets:
+            # values_only streams plain values without creating a Cell object per cell
+            for row in sheet.iter_rows(values_only=True):
+                row_text = [str(value) for value in row if value]
+                if row_text:
+                    full_text.append(' '.join(row_text))
+        return '\n'.join(full_text)
+    finally:
+        workbook.close()
+
+
+def _extract_pdf(data):
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(data)
+            try:
+                return '\n'.join(page.get_textpage().get_text_range() for page in pdf)
+            finally:
+                pdf.close()
+        except pdfium.PdfiumError as e:
+            print(f"PDFium could not read the file, falling back to PyPDF2: {e}")
+    reader = PdfReader(io.BytesIO(data))
+    full_text = [page.extract_text() for page in reader.pages if page.extract_text()]
+    return '\n'.join(full_text)
+
+
+# Text extractor per lowercase file extension
+EXTRACTORS = {
+    '.txt': _extract_plain,
+    '.md': _extract_plain,
+    '.json': _extract_plain,
+    '.html': _extract_html,
+    '.htm': _extract_html,
+    '.docx': _extract_docx,
+    '.xlsx': _extract_xlsx,
+    '.pdf': _extract_pdf,
+}
+
+
+def sha256_file(f):
+    """Returns the SHA-256 hex digest of an open binary file, read in fixed-size chunks."""
+    if hasattr(hashlib, 'file_digest'):  # Python 3.11+: hashes in C into a reused buffer
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+    hasher = hashlib.sha256()
+    for chunk in iter(lambda: f.read(256 * 1024), b''):
+        hasher.update(chunk)
+    return hasher.hexdigest()
+
+
+def _hash_and_extract(filepath, known_hash=None):
+    """
+    Hashes a file and, only if its contents changed, reads it again to extract its text.
+
+    Returns:
+        tuple: (sha256 hex digest, changed, text). The hash is None for unsupported
+            or unreadable files; text is None when unchanged or extraction failed.
+    """
+    extractor = EXTRACTORS.get(os.path.splitext(filepath)[1].lower())
+    if extractor is None:
+        return None, False, None  # Nothing would be indexed, so don't read it
+    try:
+        with open(filepath, 'rb') as f:
+            # Streams through a fixed buffer; unchanged files are never held in memory
+            file_hash = sha256_file(f)
+            if file_hash == known_hash:
+                return file_hash, False, None
+            f.seek(0)
+            data = f.read()
+    except OSError as e:
+        print(f"Error reading {filepath}: {e}")
+        return None, False, None
+
+    try:
+        return file_hash, True, extractor(data)
+    except Exception as e:
+        print(f"Error extracting text from {filepath}: {e}")
+        return file_hash, True, None
+
+
+def _walk_files(directory):
+    """Yields a DirEntry for every non-hidden file below directory, recursively."""
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        yield from _walk_files(entry.path)
+                    elif entry.is_file() and not entry.name.startswith('.'):
+                        yield entry
+                except OSError:
+                    continue
+    except OSError as e:
+        print(f"Error scanning {directory}: {e}")
+
+
 class FolderIndexer:
     """Handles indexing of files in specified folders into a ChromaDB collection."""
 
     def __init__(self, collection, db):
         self.collection = collection
         self.db = db
-
-    def _calculate_file_hash(self, filepath):
-        """Calculates the SHA-256 hash of a file."""
-        hasher = hashlib.sha256()
-        try:
-            with open(filepath, 'rb') as f:
-                while chunk := f.read(8192):
-                    hasher.update(chunk)
-            return hasher.hexdigest()
-        except (IOError, FileNotFoundError) as e:
-            print(f"Error calculating hash for {filepath}: {e}")
-            return None
+        # Guards the Chroma and DB writes of a window and removals, which touch the same
+        # rows and ids; scanning, hashing and extraction run outside it
+        self._lock = threading.RLock()
+        # Bumped by every folder removal; index work started before a removal drops the
+        # paths below that folder instead of writing them back
+        self._removal_seq = 0
+        self._removed_at = {}  # folder prefix -> _removal_seq of its last removal
 
     def _split_text(self, text, chunk_size=1000, chunk_overlap=200):
         """A simple text splitter."""
         if not text:
             return []
-        
-        chunks = []
-        start = 0
-        while start < len(text):
-            end = start + chunk_size
-            chunks.append(text[start:end])
-            start += chunk_size - chunk_overlap
-            if start < 0: # overlap is larger than chunk size
-                start = end
-        return chunks
-
-    def _extract_text(self, filepath):
-        """Extracts text content from a file based on its extension."""
-        content = ""
-        try:
-            extension = os.path.splitext(filepath)[1].lower()
-            if extension in ['.txt', '.md', '.json']:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    content = f.read()
-            elif extension in ['.html', '.htm']:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    soup = BeautifulSoup(f, 'html.parser')
-                    content = soup.get_text(separator='\n', strip=True)
-            elif extension == '.docx':
-                doc = docx.Document(filepath)
-                content = '\n'.join([para.text for para in doc.paragraphs])
-            elif extension == '.xlsx':
-                workbook = openpyxl.load_workbook(filepath, read_only=True)
-                full_text = []
-                for sheet_name in workbook.sheetnames:
-                    sheet = workbook[sheet_name]
-                    for row in sheet.iter_rows():
-                        row_text = [str(cell.value) for cell in row if cell.value]
-                        if row_text:
-                            full_text.append(' '.join(row_text))
-                content = '\n'.join(full_text)
-            elif extension == '.pdf':
-                with open(filepath, 'rb') as f:
-                    reader = PdfReader(f)
-                    full_text = [page.extract_text() for page in reader.pages if page.extract_text()]
-                    content = '\n'.join(full_text)
-        except Exception as e:
-            print(f"Error extracting text from {filepath}: {e}")
-            return None
-        return content
+
+        step = chunk_size - chunk_overlap
+        if step <= 0:  # overlap is not smaller than chunk size
+            step = chunk_size
+        return [text[start:start + chunk_size] for start in range(0, len(text), step)]
 
     def index_folder(self, folder_path_str):
         """Indexes files in a folder, handling new, modified, and deleted files."""
+        seq = self._removal_seq
         print(f"Indexing folder: {folder_path_str}")
         folder_path = Path(folder_path_str)
         if not folder_path.is_dir():
             print(f"Error: {folder_path_str} is not a valid directory.")
             return
 
-        indexed_files_db = self.db.get_indexed_files_by_folder(folder_path_str)
+        indexed_files_db = self.db.get_indexed_files_meta_by_folder(folder_path_str)
         
         current_files_on_disk = set()
-        files_to_index = []
+        changed_files = []
 
-        for filepath in folder_path.rglob('*'):
-            if filepath.is_file() and not filepath.name.startswith('.'):
-                str_filepath = str(filepath)
-                current_files_on_disk.add(str_filepath)
-                
-                try:
-                    mtime = os.path.getmtime(filepath)
-                    size = os.path.getsize(filepath)
-                    
-                    db_record = indexed_files_db.get(str_filepath)
-
-                    if not db_record or mtime > db_record['modified_time'] or size != db_record['size']:
-                        file_hash = self._calculate_file_hash(filepath)
-                        if not file_hash: continue
-
-                        if not db_record or file_hash != db_record['file_hash']:
-                            files_to_index.append({
-                                "path": filepath,
-                                "mtime": mtime,
-                                "size": size,
-                                "hash": file_hash
-                            })
-
-                except FileNotFoundError:
-                    continue
+        # Serial scan: one stat per file, files that look changed are hashed below
+        for entry in _walk_files(str(folder_path)):
+            str_filepath = entry.path
+            current_files_on_disk.add(str_filepath)
+
+            try:
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            mtime = st.st_mtime
+            size = st.st_size
+
+            db_record = indexed_files_db.get(str_filepath)
+
+            # != rather than > so files restored with an older mtime are checked too
+            if not db_record or mtime != db_record['modified_time'] or size != db_record['size']:
+                changed_files.append({
+                    "path": str_filepath,
+                    "mtime": mtime,
+                    "size": size
+                })
 
         indexed_files_paths_db = set(indexed_files_db.keys())
         deleted_files_paths = indexed_files_paths_db - current_files_on_disk
+
+        with ThreadPoolExecutor(max_workers=INDEX_WORKERS) as executor:
+            self._apply_index_changes(indexed_files_db, deleted_files_paths, changed_files, executor, seq)
         
+        print(f"Finished indexing {folder_path_str}.")
+
+    def _apply_index_changes(self, indexed_files_db, deleted_files_paths, changed_files, executor, seq):
+        """Drops deleted files and (re)indexes changed ones, committing after each Chroma step."""
         if deleted_files_paths:
-            ids_to_delete_chroma = []
-            for str_filepath in deleted_files_paths:
-                db_record = indexed_files_db.get(str_filepath)
-                if db_record and db_record.get('chunk_ids'):
-                    chunk_ids = json.loads(db_record['chunk_ids'])
-                    ids_to_delete_chroma.extend(chunk_ids)
-                self.db.delete_indexed_file(str_filepath)
-            
+            self.remove_files(deleted_files_paths)
+            print(f"Removed {len(deleted_files_paths)} deleted files from index.")
+
+        # Files are hashed and extracted in parallel; Chroma and the DB are written from this
+        # thread only. Windows of a few files per worker bound how much text is held at once.
+        window = INDEX_WORKERS * 4
+        for start in range(0, len(changed_files), window):
+            if changed_files and self._removed_since(changed_files[0]['path'], seq):
+                return  # The folder was removed during this pass
+            self._index_files(changed_files[start:start + window], indexed_files_db, seq, executor.map)
+
+    def _removed_since(self, path, seq):
+        """True if a folder containing path was removed after removal counter value seq."""
+        return any(seq < removed and path.startswith(prefix) for prefix, removed in self._removed_at.items())
+
+    def _index_files(self, changed_files, indexed_files_db, seq, map_fn=map):
+        paths = [f['path'] for f in changed_files]
+        known_hashes = [indexed_files_db[p]['file_hash'] if p in indexed_files_db else None for p in paths]
+        results = list(map_fn(_hash_and_extract, paths, known_hashes))
+
+        touched = []
+        updated = []
+        for file_info, (file_hash, changed, content) in zip(changed_files, results):
+            if not file_hash:
+                continue
+            if not changed:
+                # Same contents, only the metadata moved; record it so the file isn't re-read
+                touched.append(file_info)
+                continue
+            chunks = self._split_text(content) if content else []
+            updated.append((file_info, file_hash, chunks))
+
+        with self._lock:
+            touched = [f for f in touched if not self._removed_since(f['path'], seq)]
+            updated = [u for u in updated if not self._removed_since(u[0]['path'], seq)]
+            if not touched and not updated:
+                return
+
+            # Old chunks of every re-indexed file in this window go in one Chroma call. They
+            # are looked up under the lock, so chunks another pass added meanwhile go too.
+            ids_to_delete_chroma = self.db.get_chunk_ids_for_files([u[0]['path'] for u in updated])
             if ids_to_delete_chroma:
                 self.collection.delete(ids=ids_to_delete_chroma)
-            print(f"Removed {len(deleted_files_paths)} deleted files from index.")
 
-        for file_info in files_to_index:
-            filepath = file_info['path']
-            str_filepath = str(filepath)
-            print(f"Processing: {str_filepath}")
-            
-            # If file was already indexed, delete old chunks from Chroma
-            db_record = indexed_files_db.get(str_filepath)
-            if db_record and db_record.get('chunk_ids'):
-                old_chunk_ids = json.loads(db_record['chunk_ids'])
-                if old_chunk_ids:
-                    self.collection.delete(ids=old_chunk_ids)
-
-            content = self._extract_text(filepath)
-            if content:
-                chunks = self._split_text(content)
+            written = []
+            for file_info, file_hash, chunks in updated:
+                str_filepath = file_info['path']
+                print(f"Processing: {str_filepath}")
+                if not chunks:
+                    continue
                 chunk_ids = [f"{str_filepath}_{i}" for i in range(len(chunks))]
-                
-                if chunks:
-                    batch_size = 1000  # A safe batch size to avoid exceeding limits
-                    for i in range(0, len(chunks), batch_size):
-                        batch_chunks = chunks[i:i + batch_size]
-                        batch_ids = chunk_ids[i:i + batch_size]
-                        batch_metadatas = [{"source": str_filepath}] * len(batch_chunks)
-                        
-                        self.collection.add(
-                            documents=batch_chunks,
-                            metadatas=batch_metadatas,
-                            ids=batch_ids
-                        )
-                
+                batch_size = 5000  # Below Chroma's max batch size (5461 with the default SQLite backend)
+                for i in range(0, len(chunks), batch_size):
+                    batch_chunks = chunks[i:i + batch_size]
+                    batch_ids = chunk_ids[i:i + batch_size]
+                    batch_metadatas = [{"source": str_filepath}] * len(batch_chunks)
+
+                    self.collection.add(
+                        documents=batch_chunks,
+                        metadatas=batch_metadatas,
+                        ids=batch_ids
+                    )
+                written.append((file_info, file_hash, chunk_ids))
+
+            # DB rows of this window, written and committed once its Chroma writes are done
+            # so a committed row never points at chunks Chroma doesn't have
+            self._write_index_rows(touched, written)
+
+    def _write_index_rows(self, touched, updated):
+        with self.db.write_batch():
+            for file_info in touched:
+                self.db.touch_indexed_file(file_info['path'], file_info['size'], file_info['mtime'], commit=False)
+            for file_info, file_hash, chunk_ids in updated:
                 # Update database with new file info
                 self.db.update_indexed_file(
-                    filepath=str_filepath,
+                    filepath=file_info['path'],
                     size=file_info['size'],
                     modified_time=file_info['mtime'],
-                    file_hash=file_info['hash'],
-                    chunk_ids=chunk_ids
+                    file_hash=file_hash,
+                    chunk_ids=chunk_ids,
+                    commit=False
                 )
-        
-        print(f"Finished indexing {folder_path_str}.")
+
+    def index_file(self, filepath):
+        """Indexes a single file if it changed since it was last indexed; drops it if it is gone."""
+        if os.path.splitext(filepath)[1].lower() not in EXTRACTORS:
+            return
+        seq = self._removal_seq
+        try:
+            st = os.stat(filepath)
+        except FileNotFoundError:
+            self.remove_files([filepath])
+            return
+        record = self.db.get_indexed_file(filepath)
+        # Watcher events for files whose (mtime, size) still match the index (e.g. a save
+        # without changes, or the closed event after a modify) end here
+        if record and record['modified_time'] == st.st_mtime and record['size'] == st.st_size:
+            return
+        indexed_files_db = {filepath: record} if record else {}
+        self._index_files([{"path": filepath, "mtime": st.st_mtime, "size": st.st_size}], indexed_files_db, seq)
+
+    def remove_files(self, filepaths):
+        """Removes the given files from ChromaDB and the database, if they were indexed."""
+        with self._lock:
+            ids_to_delete_chroma = self.db.get_chunk_ids_for_files(filepaths)
+            if ids_to_delete_chroma:
+                self.collection.delete(ids=ids_to_delete_chroma)
+            with self.db.write_batch():
+                self.db.delete_indexed_files(filepaths, commit=False)
 
     def remove_folder_from_index(self, folder_path_str):
         """Removes all indexed files for a given folder from ChromaDB and the database."""
+        with self._lock:
+            self._removal_seq += 1
+            self._removed_at[folder_path_str.rstrip(os.sep) + os.sep] = self._removal_seq
+            self._remove_folder_from_index(folder_path_str)
+
+    def _remove_folder_from_index(self, folder_path_str):
         print(f"Removing folder {folder_path_str} from index...")
-        indexed_files_db = self.db.get_indexed_files_by_folder(folder_path_str)
+        indexed_files_db = self.db.get_indexed_files_meta_by_folder(folder_path_str)
         
         if not indexed_files_db:
             print("Folder was not in the index.")
             return
 
-        ids_to_delete_chroma = []
-        for str_filepath, db_record in indexed_files_db.items():
-            if db_record and db_record.get('chunk_ids'):
-                chunk_ids = json.loads(db_record['chunk_ids'])
-                ids_to_delete_chroma.extend(chunk_ids)
-            
-            # Delete from SQLite DB
-            self.db.delete_indexed_file(str_filepath)
+        ids_to_delete_chroma = self.db.get_chunk_ids_by_folder(folder_path_str)
+
+        # Delete from SQLite DB
+        with self.db.write_batch():
+            self.db.delete_indexed_files(indexed_files_db.keys(), commit=False)
 
         if ids_to_delete_chroma:
             self.collection.delete(ids=ids_to_delete_chroma)
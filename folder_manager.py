@@ -1,9 +1,70 @@
 # [file name]: folder_manager.py
 """Folder management and indexing for recass."""
 
+import os
 import threading
 import time
-from gi.repository import Gtk
+from gi.repository import GLib, Gtk
+
+from config import load_user_settings, save_user_settings
+
+try:
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+    from watchdog.observers.polling import PollingObserver
+except ImportError:
+    FileSystemEventHandler = object
+    Observer = None
+    PollingObserver = None
+
+# Default seconds between full re-index passes when no event watcher is available, and
+# the poll interval for folders on network mounts (inotify does not see remote changes).
+# Overridden by the 'watch_interval' user setting.
+DEFAULT_WATCH_INTERVAL = 300
+# Quiet period before queued file events are indexed; editors save in bursts
+WATCH_DEBOUNCE_SECONDS = 1.0
+NETWORK_FS_TYPES = {'nfs', 'nfs4', 'cifs', 'smbfs', 'smb3', 'fuse.sshfs', '9p'}
+
+
+def _is_network_mount(path):
+    """Returns True if path lives on a network filesystem (Linux, via /proc/mounts)."""
+    try:
+        with open('/proc/mounts', 'r', encoding='utf-8') as f:
+            mounts = [line.split()[1:3] for line in f]
+    except OSError:
+        return False
+    path = os.path.realpath(path)
+    best_mount, best_type = '', None
+    for mount_point, fs_type in mounts:
+        mount_point = mount_point.replace('\\040', ' ')
+        if (path == mount_point or path.startswith(mount_point.rstrip('/') + '/')) and len(mount_point) > len(best_mount):
+            best_mount, best_type = mount_point, fs_type
+    return best_type in NETWORK_FS_TYPES
+
+
+class _FolderEventHandler(FileSystemEventHandler):
+    """Forwards file system events of watched folders to the FolderManager."""
+
+    def __init__(self, manager):
+        super().__init__()
+        self.manager = manager
+
+    def on_created(self, event):
+        self.manager._queue_change(event.src_path, event.is_directory)
+
+    def on_modified(self, event):
+        if not event.is_directory:
+            self.manager._queue_change(event.src_path, False)
+
+    def on_closed(self, event):
+        self.manager._queue_change(event.src_path, False)
+
+    def on_deleted(self, event):
+        self.manager._queue_change(event.src_path, event.is_directory, deleted=True)
+
+    def on_moved(self, event):
+        self.manager._queue_change(event.src_path, event.is_directory, deleted=True)
+        self.manager._queue_change(event.dest_path, event.is_directory)
 
 
 class FolderManager:
@@ -19,6 +80,21 @@ class FolderManager:
         self.app = application
         self.watcher_thread = None
         self.watcher_stop_event = None
+        self.interval = max(1, int(load_user_settings().get('watch_interval', DEFAULT_WATCH_INTERVAL)))
+        # Event-based watching (watchdog): one inotify observer plus one polling
+        # observer for network mounts, and the scheduled watch per folder
+        self._observer = None
+        self._polling_observer = None
+        self._watches = {}
+        # Paths changed since the last flush, mapped to (is_directory, deleted)
+        self._pending_changes = {}
+        self._pending_lock = threading.Lock()
+        # One flush thread per watcher run; each event only pushes the deadline back
+        self._flush_deadline = 0.0
+        self._flush_event = threading.Event()
+        self._flush_stop_event = None
+        self._flush_thread = None
+        self._interval_timeout_id = None
     
     def on_add_folder_clicked(self, widget):
         """Handle Add Folder button click."""
@@ -35,7 +111,7 @@ class FolderManager:
         response = dialog.run()
         if response == Gtk.ResponseType.OK:
             folder_path = dialog.get_filename()
-            if folder_path and folder_path not in self.app.source_folders:
+            if folder_path and folder_path not in self.app._source_folders_set:
                 # Add to UI
                 label = Gtk.Label(label=folder_path)
                 label.set_xalign(0)
@@ -43,11 +119,10 @@ class FolderManager:
                 self.app.folders_listbox.show_all()
                 
                 # Update settings
-                self.app.source_folders.append(folder_path)
-                from config import load_user_settings, save_user_settings
-                settings = load_user_settings()
-                settings['source_folders'] = self.app.source_folders
-                save_user_settings(settings)
+                with self.app._source_folders_lock:
+                    self.app.source_folders.append(folder_path)
+                    self.app._source_folders_set.add(folder_path)
+                self._save_source_folders()
                 print(f"Source folder added: {folder_path}")
                 
                 if self.app.folder_indexer:
@@ -57,6 +132,7 @@ class FolderManager:
                         args=(folder_path,), 
                         daemon=True
                     ).start()
+                    self._watch_folder(folder_path)
         
         dialog.destroy()
     
@@ -66,22 +142,83 @@ class FolderManager:
         if selected_row:
             label = selected_row.get_child()
             folder_to_remove = label.get_label()
-            self.app.folders_listbox.remove(selected_row)
             
             # Update settings
-            if folder_to_remove in self.app.source_folders:
-                self.app.source_folders.remove(folder_to_remove)
-                from config import load_user_settings, save_user_settings
-                settings = load_user_settings()
-                settings['source_folders'] = self.app.source_folders
-                save_user_settings(settings)
+            if folder_to_remove in self.app._source_folders_set:
+                with self.app._source_folders_lock:
+                    self.app.source_folders.remove(folder_to_remove)
+                    self.app._source_folders_set.discard(folder_to_remove)
+                self._save_source_folders()
                 print(f"Source folder removed: {folder_to_remove}")
                 
+                self._unwatch_folder(folder_to_remove)
                 if self.app.folder_indexer:
-                    self.app.folder_indexer.remove_folder_from_index(folder_to_remove)
+                    # Removal may wait for a running index window; the row stays, greyed
+                    # out, until it is done
+                    selected_row.set_sensitive(False)
+                    threading.Thread(
+                        target=self._remove_folder_from_index,
+                        args=(folder_to_remove, selected_row),
+                        daemon=True
+                    ).start()
+                    return
+            self.app.folders_listbox.remove(selected_row)
+
+    def _remove_folder_from_index(self, folder, row):
+        try:
+            self.app.folder_indexer.remove_folder_from_index(folder)
+        finally:
+            GLib.idle_add(self.app.folders_listbox.remove, row)
     
+    def _save_source_folders(self):
+        """Writes the current source folder list to the user settings."""
+        # load_user_settings() serves the cached dict unless the file changed on disk
+        settings = load_user_settings()
+        settings['source_folders'] = list(self._source_folders_snapshot())
+        save_user_settings(settings)
+
+    def _source_folders_snapshot(self):
+        """Returns the source folders as an immutable tuple, safe to iterate from any thread."""
+        with self.app._source_folders_lock:
+            return tuple(self.app.source_folders)
+
+    def on_watch_interval_changed(self, widget):
+        """Handle changes of the watch interval spin button."""
+        # Debounce: holding a spin arrow fires a change per step
+        if self._interval_timeout_id is not None:
+            GLib.source_remove(self._interval_timeout_id)
+        self._interval_timeout_id = GLib.timeout_add(500, self._apply_watch_interval, int(widget.get_value()))
+
+    def _apply_watch_interval(self, interval):
+        self._interval_timeout_id = None
+        if interval == self.interval:
+            return False
+        self.interval = interval
+        settings = load_user_settings()
+        settings['watch_interval'] = interval
+        save_user_settings(settings)
+        print(f"Folder watch interval set to: {interval} seconds")
+
+        # The polling loop picks the new value up after its current wait; the polling
+        # observer fixes its timeout on creation, so move its watches to a new one
+        if self._polling_observer is not None:
+            old_observer = self._polling_observer
+            self._polling_observer = PollingObserver(timeout=interval)
+            self._polling_observer.start()
+            for folder, (observer, watch) in list(self._watches.items()):
+                if observer is old_observer:
+                    del self._watches[folder]
+                    self._watch_folder(folder)
+            old_observer.stop()
+            # Joining waits for the current poll to finish; keep that off the GTK thread
+            threading.Thread(target=old_observer.join, daemon=True).start()
+        return False
+
     def start_folder_watcher(self):
-        """Starts the background thread for folder watching if not already running."""
+        """Starts watching the source folders for changes if not already running."""
+        if Observer is not None:
+            self._start_event_watcher()
+            return
         if self.watcher_thread is None:
             self.watcher_stop_event = threading.Event()
             self.watcher_thread = threading.Thread(
@@ -97,15 +234,122 @@ class FolderManager:
         if self.watcher_thread:
             self.watcher_stop_event.set()
             # The thread will time out from wait() and exit
+        for observer in (self._observer, self._polling_observer):
+            if observer is not None:
+                observer.stop()
+        self._observer = None
+        self._polling_observer = None
+        self._watches.clear()
+        with self._pending_lock:
+            if self._flush_thread is not None:
+                self._flush_stop_event.set()
+                self._flush_event.set()
+                self._flush_thread = None
+
+    def _start_event_watcher(self):
+        """Watches source folders through watchdog; changed files are indexed individually."""
+        if self._observer is not None:
+            return
+        self._observer = Observer()
+        self._polling_observer = PollingObserver(timeout=self.interval)
+        for folder in self._source_folders_snapshot():
+            self._watch_folder(folder)
+        self._observer.start()
+        self._polling_observer.start()
+        print("Folder watcher started (event based).")
+
+        # Catch up on changes made while the application was not running
+        def initial_pass():
+            for folder in self._source_folders_snapshot():
+                if self.app.folder_indexer:
+                    self.app.folder_indexer.index_folder(folder)
+        threading.Thread(target=initial_pass, daemon=True).start()
+
+    def _watch_folder(self, folder):
+        if self._observer is None or folder in self._watches or not os.path.isdir(folder):
+            return
+        observer = self._polling_observer if _is_network_mount(folder) else self._observer
+        try:
+            self._watches[folder] = (observer, observer.schedule(_FolderEventHandler(self), folder, recursive=True))
+        except OSError as e:
+            # e.g. inotify watch limit reached; the folder is still indexed on start and add
+            print(f"Could not watch {folder}: {e}")
+
+    def _unwatch_folder(self, folder):
+        entry = self._watches.pop(folder, None)
+        if entry is not None:
+            observer, watch = entry
+            observer.unschedule(watch)
+        # Queued events would otherwise put the folder back into the index after removal
+        prefix = folder.rstrip(os.sep) + os.sep
+        with self._pending_lock:
+            for path in [p for p in self._pending_changes if p == folder or p.startswith(prefix)]:
+                del self._pending_changes[path]
+
+    def _queue_change(self, path, is_directory, deleted=False):
+        """Records a changed path and (re)starts the debounce timer."""
+        if not is_directory and os.path.basename(path).startswith('.'):
+            return
+        with self._pending_lock:
+            self._pending_changes[path] = (is_directory, deleted)
+            self._flush_deadline = time.monotonic() + WATCH_DEBOUNCE_SECONDS
+            if self._flush_thread is None:
+                self._flush_stop_event = threading.Event()
+                self._flush_thread = threading.Thread(
+                    target=self._flush_loop,
+                    args=(self._flush_stop_event,),
+                    daemon=True
+                )
+                self._flush_thread.start()
+            self._flush_event.set()
+
+    def _flush_loop(self, stop_event):
+        """Flushes queued changes once no new event arrived for WATCH_DEBOUNCE_SECONDS."""
+        while True:
+            self._flush_event.wait()
+            while not stop_event.is_set():
+                with self._pending_lock:
+                    delay = self._flush_deadline - time.monotonic()
+                if delay <= 0:
+                    break
+                stop_event.wait(delay)
+            if stop_event.is_set():
+                return
+            self._flush_changes()
+
+    def _flush_changes(self):
+        with self._pending_lock:
+            changes = self._pending_changes
+            self._pending_changes = {}
+            self._flush_event.clear()
+        indexer = self.app.folder_indexer
+        if not indexer:
+            return
+        # Skip paths whose source folder was removed while they were queued
+        prefixes = tuple(folder.rstrip(os.sep) + os.sep for folder in self._source_folders_snapshot())
+        changes = {path: change for path, change in changes.items() if path.startswith(prefixes)}
+        deleted_files = [path for path, (is_dir, deleted) in changes.items() if deleted and not is_dir]
+        if deleted_files:
+            indexer.remove_files(deleted_files)
+        for path, (is_directory, deleted) in changes.items():
+            try:
+                if is_directory:
+                    if deleted:
+                        indexer.remove_folder_from_index(path + os.sep)
+                    else:
+                        indexer.index_folder(path)
+                elif not deleted:
+                    indexer.index_file(path)
+            except Exception as e:
+                print(f"Error indexing change to {path}: {e}")
     
     def _watcher_loop(self, stop_event):
         """Periodically checks source folders for file changes."""
         while not stop_event.is_set():
             print("Checking source folders for updates...")
-            source_folders_copy = self.app.source_folders[:]  # work on a copy
-            for folder in source_folders_copy:
+            for folder in self._source_folders_snapshot():
                 if self.app.folder_indexer:
                     self.app.folder_indexer.index_folder(folder)
             
-            # Wait for 5 minutes or until stop event is set
-            stop_event.wait(300)
\ No newline at end of file
+            # Wait for the poll interval or until stop event is set
+            stop_event.wait(self.interval)
\ No newline at end of file
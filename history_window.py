@@ -1,8 +1,29 @@
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, Gdk
+from gi.repository import Gtk, Gdk, GLib
+
+# Characters handed to the text buffer per insert when loading a full history
+HISTORY_INSERT_BLOCK = 64 * 1024
+
+_CSS = b"""
+#HistoryWindow {
+    background-color: #2E2E2E;
+    border-radius: 15px;
+    border: 1px solid #4A4A4A;
+}
+#HistoryWindow GtkTextView {
+    background-color: #1E1E1E;
+    color: #E0E0E0;
+    padding: 10px;
+}
+#HistoryWindow GtkScrolledWindow {
+    border-radius: 15px;
+}
+"""
 
 class HistoryWindow(Gtk.Window):
+    _style_provider = None
+
     def __init__(self, application):
         super().__init__(title="Transcription History")
         self.app = application
@@ -14,28 +35,15 @@ class HistoryWindow(Gtk.Window):
 
         # Basic styling
         self.set_name("HistoryWindow")
-        style_provider = Gtk.CssProvider()
-        css = """
-        #HistoryWindow {
-            background-color: #2E2E2E;
-            border-radius: 15px;
-            border: 1px solid #4A4A4A;
-        }
-        #HistoryWindow GtkTextView {
-            background-color: #1E1E1E;
-            color: #E0E0E0;
-            padding: 10px;
-        }
-        #HistoryWindow GtkScrolledWindow {
-            border-radius: 15px;
-        }
-        """
-        style_provider.load_from_data(css.encode())
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            style_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # The provider is screen-wide, so it is added once rather than per window
+        if HistoryWindow._style_provider is None:
+            HistoryWindow._style_provider = Gtk.CssProvider()
+            HistoryWindow._style_provider.load_from_data(_CSS)
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                HistoryWindow._style_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
 
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         self.add(vbox)
@@ -50,6 +58,9 @@ class HistoryWindow(Gtk.Window):
         self.textview.set_wrap_mode(Gtk.WrapMode.WORD)
         self.textbuffer = self.textview.get_buffer()
         scrolled_window.add(self.textview)
+        # Lines appended since the last idle flush; inserted and scrolled to in one go
+        self._pending_text = []
+        self._flush_pending = False
 
         button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6, margin=5)
         vbox.pack_start(button_box, False, False, 0)
@@ -77,8 +88,21 @@ class HistoryWindow(Gtk.Window):
 
 
     def append_text(self, text):
-        end_iter = self.textbuffer.get_end_iter()
-        self.textbuffer.insert(end_iter, text + '\n')
+        self._pending_text.append(text + '\n')
+        if not self._flush_pending:
+            self._flush_pending = True
+            GLib.idle_add(self._flush_pending_text)
+
+    def _flush_pending_text(self):
+        self._flush_pending = False
+        if self._pending_text:
+            text = ''.join(self._pending_text)
+            self._pending_text = []
+            self.textbuffer.insert(self.textbuffer.get_end_iter(), text)
+            self._scroll_to_end()
+        return False
+
+    def _scroll_to_end(self):
         # auto-scroll, only if the widget is realized
         parent = self.textview.get_parent()
         if parent:
@@ -87,14 +111,27 @@ class HistoryWindow(Gtk.Window):
                 adj.set_value(adj.get_upper() - adj.get_page_size())
 
     def set_full_history(self, history_list):
-        full_text = '\n'.join(history_list)
-        self.textbuffer.set_text(full_text)
-        # auto-scroll, only if the widget is realized
-        parent = self.textview.get_parent()
-        if parent:
-            adj = parent.get_vadjustment()
-            if adj:
-                adj.set_value(adj.get_upper() - adj.get_page_size())
+        self._pending_text = []
+        # Insert in blocks of ~64K chars instead of joining the whole history into
+        # one more string; the user action groups the inserts into a single change
+        self.textbuffer.begin_user_action()
+        try:
+            self.textbuffer.set_text("")
+            block, block_len = [], 0
+            for i, line in enumerate(history_list):
+                if i:
+                    block.append('\n')
+                block.append(line)
+                block_len += len(line) + 1
+                if block_len >= HISTORY_INSERT_BLOCK:
+                    self.textbuffer.insert(self.textbuffer.get_end_iter(), ''.join(block))
+                    block, block_len = [], 0
+            if block:
+                self.textbuffer.insert(self.textbuffer.get_end_iter(), ''.join(block))
+        finally:
+            self.textbuffer.end_user_action()
+        self._scroll_to_end()
 
     def clear(self):
+        self._pending_text = []
         self.textbuffer.set_text("")
@@ -9,7 +9,7 @@ Requirements:
 
 import threading
 import os
-from typing import Callable, Dict, Optional
+from typing import Callable, Dict, Optional, Set, Tuple
 from gi.repository import GLib
 
 try:
@@ -36,11 +36,19 @@ class HotkeyManager:
         self.app_name = app_name
         self._callbacks: Dict[str, Callable] = {}
         self._shortcuts: Dict[str, dict] = {}
+        # Pre-built D-Bus structs per shortcut, reused by every BindShortcuts call
+        self._shortcut_structs: Dict[str, "dbus.Struct"] = {}
         self._running = False
         self._loop: Optional[GLib.MainLoop] = None
         self._thread: Optional[threading.Thread] = None
         self._session_handle: Optional[str] = None
         self._request_counter = 0
+        # Outstanding portal requests: request object path -> (response callback, request
+        # paths of the _wait_for that started it or None)
+        self._pending: Dict[str, Tuple[Callable, Optional[Set[str]]]] = {}
+        # The current waiter's request set, while its start() or one of its callbacks runs;
+        # requests started then belong to that waiter only
+        self._waiter = threading.local()
         
         # Initialize D-Bus
         DBusGMainLoop(set_as_default=True)
@@ -88,60 +96,195 @@ class HotkeyManager:
                 path_keyword='path'
             )
             
+            # One receiver for the Response of every request, dispatched by object path
+            self._session_bus.add_signal_receiver(
+                self._on_request_response,
+                signal_name='Response',
+                dbus_interface='org.freedesktop.portal.Request',
+                path_keyword='path'
+            )
+            
         except dbus.exceptions.DBusException as e:
             raise RuntimeError(f"Failed to connect to GlobalShortcuts portal: {e}")
     
-    def _create_session(self) -> bool:
-        """Create a GlobalShortcuts session."""
-        if self._session_handle:
-            return True
+    def _portal_request(self, method_name: str, args: list, options: dict, on_response: Callable) -> str:
+        """
+        Call a GlobalShortcuts portal method without blocking.
         
-        try:
-            request_token = self._get_request_token()
-            session_token = self._get_session_token()
-            
-            # Expected request object path
-            request_path = f"/org/freedesktop/portal/desktop/request/{self._sender_name}/{request_token}"
-            
-            # Set up response handler before making the call
-            response_received = threading.Event()
-            session_result = {'handle': None, 'success': False}
-            
-            def on_response(response, results):
-                if response == 0:  # Success
-                    session_result['handle'] = results.get('session_handle', '')
-                    session_result['success'] = True
-                response_received.set()
+        The portal answers through a Response signal on a per-call Request object;
+        on_response(response, results) is called from the GLib main loop once it
+        arrives (response 0 = success). The shared Response receiver looks the
+        callback up in _pending by request path and removes it after that one answer.
+        
+        Args:
+            method_name: Portal method, e.g. "CreateSession"
+            args: Positional arguments before the options dictionary
+            options: Extra method options; the handle_token is added here
+            on_response: Callback receiving (response, results)
             
-            self._session_bus.add_signal_receiver(
-                on_response,
-                signal_name='Response',
-                dbus_interface='org.freedesktop.portal.Request',
-                path=request_path
+        Returns:
+            The request object path the Response will arrive on
+        """
+        request_token = self._get_request_token()
+        request_path = f"/org/freedesktop/portal/desktop/request/{self._sender_name}/{request_token}"
+        
+        def handle_error(e):
+            entry = self._pending.pop(request_path, None)
+            if entry is not None:
+                print(f"{method_name} failed: {e}")
+                self._dispatch(entry, 2, {})
+        
+        # Registered before the call so an early Response isn't missed
+        requests = getattr(self._waiter, 'requests', None)
+        self._pending[request_path] = (on_response, requests)
+        if requests is not None:
+            requests.add(request_path)
+        options = dbus.Dictionary(dict(options, handle_token=dbus.String(request_token)), signature='sv')
+        try:
+            getattr(self._shortcuts_interface, method_name)(
+                *args, options,
+                reply_handler=lambda handle: None,  # Result arrives via the Response signal
+                error_handler=handle_error
             )
+        except dbus.exceptions.DBusException as e:
+            handle_error(e)
+        return request_path
+    
+    def _on_request_response(self, response, results, path=None):
+        """Dispatch a portal Response signal to the request waiting on it."""
+        entry = self._pending.pop(str(path), None)
+        if entry is not None:
+            self._dispatch(entry, response, results)
+    
+    def _dispatch(self, entry: Tuple[Callable, Optional[Set[str]]], response, results):
+        """Run a response callback as its waiter, so follow-up requests are tracked with it."""
+        callback, requests = entry
+        previous = getattr(self._waiter, 'requests', None)
+        self._waiter.requests = requests
+        try:
+            callback(response, results)
+        finally:
+            self._waiter.requests = previous
+    
+    def _wait_for(self, start: Callable, timeout: float = 5.0):
+        """
+        Run an asynchronous operation and block until it reports its result.
+        
+        Args:
+            start: Called with a done(value) callback that the operation calls once
+            timeout: Seconds to wait before giving up
             
-            options = dbus.Dictionary({
-                'handle_token': dbus.String(request_token),
-                'session_handle_token': dbus.String(session_token),
-            }, signature='sv')
-            
-            self._shortcuts_interface.CreateSession(options)
+        Returns:
+            The value passed to done, or None on timeout
+        """
+        result = {}
+        done = threading.Event()
+        requests: Set[str] = set()
+        
+        def finish(value):
+            result['value'] = value
+            done.set()
+        
+        previous = getattr(self._waiter, 'requests', None)
+        self._waiter.requests = requests
+        try:
+            start(finish)
+        finally:
+            self._waiter.requests = previous
+        if self._thread is not None and self._thread is not threading.current_thread():
+            # The background loop dispatches the Response signal
+            done.wait(timeout=timeout)
+        else:
+            # No loop running elsewhere (or we are on it): drive the default context here
+            context = GLib.MainContext.default()
+            timed_out = []
             
-            # Wait for response (with timeout)
-            if response_received.wait(timeout=5.0):
-                if session_result['success']:
-                    self._session_handle = session_result['handle']
-                    if not self._session_handle:
-                        # Construct session handle if not returned
-                        self._session_handle = f"/org/freedesktop/portal/desktop/session/{self._sender_name}/{session_token}"
-                    return True
+            def on_timeout():
+                timed_out.append(True)
+                done.set()
+                return False
             
-            print("Failed to create session: timeout or error")
-            return False
+            source_id = GLib.timeout_add(int(timeout * 1000), on_timeout)
+            while not done.is_set():
+                context.iteration(True)
+            if not timed_out:
+                GLib.source_remove(source_id)
+        if 'value' not in result:
+            # Timed out: a late Response must not reach callbacks whose caller gave up
+            for request_path in requests:
+                self._pending.pop(request_path, None)
+        return result.get('value')
+    
+    def _create_session_async(self, done: Callable):
+        """Create a GlobalShortcuts session; done(success) is called once it exists."""
+        if self._session_handle:
+            done(True)
+            return
+        
+        session_token = self._get_session_token()
+        
+        def on_response(response, results):
+            if response == 0:  # Success
+                self._session_handle = results.get('session_handle', '')
+                if not self._session_handle:
+                    # Construct session handle if not returned
+                    self._session_handle = f"/org/freedesktop/portal/desktop/session/{self._sender_name}/{session_token}"
+            done(response == 0)
+        
+        self._portal_request(
+            'CreateSession', [],
+            {'session_handle_token': dbus.String(session_token)},
+            on_response
+        )
+    
+    def _create_session(self) -> bool:
+        """Create a GlobalShortcuts session."""
+        if self._wait_for(self._create_session_async):
+            return True
+        print("Failed to create session: timeout or error")
+        return False
+    
+    def register_hotkey_async(
+        self, 
+        shortcut_id: str, 
+        key_combination: str, 
+        callback: Callable,
+        description: str = "",
+        done: Optional[Callable] = None
+    ):
+        """
+        Register a global hotkey without blocking.
+        
+        Args:
+            shortcut_id: Unique identifier for this shortcut (e.g., "toggle_window")
+            key_combination: Key combination string (e.g., "Meta+Shift+A", "Ctrl+Alt+T")
+            callback: Function to call when the hotkey is triggered
+            description: Human-readable description of what the shortcut does
+            done: Optional callback receiving True/False once the portal answered
+        """
+        done = done or (lambda success: None)
+        
+        def on_session(success):
+            if not success:
+                print("Failed to create session for hotkey registration")
+                done(False)
+                return
             
-        except dbus.exceptions.DBusException as e:
-            print(f"Failed to create session: {e}")
-            return False
+            self._callbacks[shortcut_id] = callback
+            self._shortcuts[shortcut_id] = {
+                'key': key_combination,
+                'description': description
+            }
+            shortcut_dict = dbus.Dictionary({
+                'description': dbus.String(description or shortcut_id),
+                'preferred_trigger': dbus.String(key_combination),
+            }, signature='sv')
+            self._shortcut_structs[shortcut_id] = dbus.Struct(
+                (dbus.String(shortcut_id), shortcut_dict), signature='sa{sv}'
+            )
+            self._bind_shortcuts_async(done)
+        
+        self._create_session_async(on_session)
     
     def register_hotkey(
         self, 
@@ -162,79 +305,41 @@ class HotkeyManager:
         Returns:
             True if registration was successful, False otherwise
         """
-        # Ensure session exists
-        if not self._create_session():
-            print("Failed to create session for hotkey registration")
-            return False
+        # Session creation and binding are two portal round trips
+        return bool(self._wait_for(
+            lambda done: self.register_hotkey_async(shortcut_id, key_combination, callback, description, done),
+            timeout=10.0
+        ))
+    
+    def _bind_shortcuts_async(self, done: Callable):
+        """Bind all registered shortcuts via the portal; done(success) reports the result."""
+        if not self._session_handle:
+            done(False)
+            return
         
-        self._callbacks[shortcut_id] = callback
-        self._shortcuts[shortcut_id] = {
-            'key': key_combination,
-            'description': description
-        }
+        def on_response(response, results):
+            if response == 0:
+                # Print bound shortcuts info
+                shortcuts = results.get('shortcuts', [])
+                for shortcut in shortcuts:
+                    print(f"Bound shortcut: {shortcut}")
+            done(response == 0)
         
-        return self._bind_shortcuts()
+        # Structs are built once in register_hotkey_async
+        shortcuts_array = dbus.Array(self._shortcut_structs.values(), signature='(sa{sv})')
+        self._portal_request(
+            'BindShortcuts',
+            [dbus.ObjectPath(self._session_handle), shortcuts_array, dbus.String("")],  # "" = parent_window
+            {},
+            on_response
+        )
     
     def _bind_shortcuts(self) -> bool:
         """Bind all registered shortcuts via the portal."""
-        if not self._session_handle:
-            return False
-        
-        try:
-            request_token = self._get_request_token()
-            request_path = f"/org/freedesktop/portal/desktop/request/{self._sender_name}/{request_token}"
-            
-            response_received = threading.Event()
-            bind_result = {'success': False}
-            
-            def on_response(response, results):
-                bind_result['success'] = (response == 0)
-                if response == 0:
-                    # Print bound shortcuts info
-                    shortcuts = results.get('shortcuts', [])
-                    for shortcut in shortcuts:
-                        print(f"Bound shortcut: {shortcut}")
-                response_received.set()
-            
-            self._session_bus.add_signal_receiver(
-                on_response,
-                signal_name='Response',
-                dbus_interface='org.freedesktop.portal.Request',
-                path=request_path
-            )
-            
-            # Build shortcuts array
-            shortcuts_array = dbus.Array([], signature='(sa{sv})')
-            for shortcut_id, info in self._shortcuts.items():
-                shortcut_dict = dbus.Dictionary({
-                    'description': dbus.String(info['description'] or shortcut_id),
-                    'preferred_trigger': dbus.String(info['key']),
-                }, signature='sv')
-                shortcuts_array.append(
-                    dbus.Struct((dbus.String(shortcut_id), shortcut_dict), signature='sa{sv}')
-                )
-            
-            options = dbus.Dictionary({
-                'handle_token': dbus.String(request_token),
-            }, signature='sv')
-            
-            self._shortcuts_interface.BindShortcuts(
-                dbus.ObjectPath(self._session_handle),
-                shortcuts_array,
-                dbus.String(""),  # parent_window
-                options
-            )
-            
-            # Wait for response
-            if response_received.wait(timeout=5.0):
-                return bind_result['success']
-            
+        result = self._wait_for(self._bind_shortcuts_async)
+        if result is None:
             print("Bind shortcuts timeout")
-            return False
-            
-        except dbus.exceptions.DBusException as e:
-            print(f"Failed to bind shortcuts: {e}")
-            return False
+        return bool(result)
     
     def unregister_hotkey(self, shortcut_id: str) -> bool:
         """
@@ -250,6 +355,7 @@ class HotkeyManager:
             del self._callbacks[shortcut_id]
         if shortcut_id in self._shortcuts:
             del self._shortcuts[shortcut_id]
+        self._shortcut_structs.pop(shortcut_id, None)
         
         # Re-bind remaining shortcuts (effectively removing the unregistered one)
         if self._shortcuts:
@@ -304,40 +410,18 @@ class HotkeyManager:
             print("No active session")
             return
         
-        try:
-            request_token = self._get_request_token()
-            request_path = f"/org/freedesktop/portal/desktop/request/{self._sender_name}/{request_token}"
-            
-            response_received = threading.Event()
-            
+        def start(done):
             def on_response(response, results):
                 if response == 0:
                     shortcuts = results.get('shortcuts', [])
                     print("Currently bound shortcuts:")
                     for shortcut in shortcuts:
                         print(f"  - {shortcut}")
-                response_received.set()
-            
-            self._session_bus.add_signal_receiver(
-                on_response,
-                signal_name='Response',
-                dbus_interface='org.freedesktop.portal.Request',
-                path=request_path
-            )
+                done(response == 0)
             
-            options = dbus.Dictionary({
-                'handle_token': dbus.String(request_token),
-            }, signature='sv')
-            
-            self._shortcuts_interface.ListShortcuts(
-                dbus.ObjectPath(self._session_handle),
-                options
-            )
-            
-            response_received.wait(timeout=5.0)
-            
-        except dbus.exceptions.DBusException as e:
-            print(f"Failed to list shortcuts: {e}")
+            self._portal_request('ListShortcuts', [dbus.ObjectPath(self._session_handle)], {}, on_response)
+        
+        self._wait_for(start)
     
     def __enter__(self):
         """Context manager entry."""
@@ -2,7 +2,26 @@ import gi
 gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, Gdk
 
+_CSS = b"""
+#InconsistencyWindow {
+    background-color: #3C3C3C;
+    border-radius: 15px;
+    border: 1px solid #FF5555;
+}
+#InconsistencyWindow GtkTextView {
+    background-color: #1E1E1E;
+    color: #E0E0E0;
+    padding: 10px;
+}
+#InconsistencyWindow GtkLabel {
+    color: #FFFFFF;
+    font-weight: bold;
+}
+"""
+
 class InconsistencyWindow(Gtk.Window):
+    _style_provider = None
+
     def __init__(self, parent):
         super().__init__(title="Inconsistency Detected", transient_for=parent)
         self.set_default_size(500, 400)
@@ -10,29 +29,15 @@ class InconsistencyWindow(Gtk.Window):
 
         # Basic styling
         self.set_name("InconsistencyWindow")
-        style_provider = Gtk.CssProvider()
-        css = """
-        #InconsistencyWindow {
-            background-color: #3C3C3C;
-            border-radius: 15px;
-            border: 1px solid #FF5555;
-        }
-        #InconsistencyWindow GtkTextView {
-            background-color: #1E1E1E;
-            color: #E0E0E0;
-            padding: 10px;
-        }
-        #InconsistencyWindow GtkLabel {
-            color: #FFFFFF;
-            font-weight: bold;
-        }
-        """
-        style_provider.load_from_data(css.encode())
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            style_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # The provider is screen-wide, so it is added once rather than per window
+        if InconsistencyWindow._style_provider is None:
+            InconsistencyWindow._style_provider = Gtk.CssProvider()
+            InconsistencyWindow._style_provider.load_from_data(_CSS)
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                InconsistencyWindow._style_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
 
         vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6, margin=10)
         self.add(vbox)
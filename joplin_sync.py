@@ -1,9 +1,20 @@
 # [file name]: joplin_sync.py
 """Joplin note synchronization functionality."""
 
+import json
+import re
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+try:
+    import orjson  # optional, faster parsing of the folder list pages
+except ImportError:
+    orjson = None
+
+# Meeting folder names look like 'meeting-2025-12-11-00-50-12'
+_MEETING_FOLDER_RE = re.compile(r'^meeting-(\d{4})-(\d{2})-(\d{2})-(\d{2})-(\d{2})-(\d{2})$')
+
 
 class JoplinSync:
     """Handles synchronization with Joplin notes app."""
@@ -17,19 +28,33 @@ class JoplinSync:
         """
         self.app = application
         self.joplin_url = "http://localhost:41184"  # Default Joplin Web Clipper port
+        # Syncs run off the caller's thread; a single worker keeps notes in order and
+        # avoids two syncs creating the same destination folder concurrently
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="joplin-sync")
+        # Keep-alive connection reused for the folder pages and the note POST; the token
+        # is still passed per request since it can be changed in the settings at any time
+        self.session = requests.Session()
+        # Folder name -> Joplin folder ID, so the folder list is only paged through once
+        self._folder_id_cache = {}
     
     def sync_analysis(self, analysis, meeting_folder, final_inconsistencies_note: str = ""):
         """
-        Sync meeting analysis to Joplin.
+        Sync meeting analysis to Joplin in the background.
         
         Args:
             analysis: The analysis text to sync
             meeting_folder: The meeting folder name
             final_inconsistencies_note: Any consistency check notes to append to the analysis.
+
+        Returns:
+            Future of the sync, or None if Joplin sync is disabled
         """
         if not self.app.joplin_sync_enabled:
-            return
-            
+            return None
+        return self._executor.submit(self._sync_analysis, analysis, meeting_folder, final_inconsistencies_note)
+
+    def _sync_analysis(self, analysis, meeting_folder, final_inconsistencies_note):
+        """Worker for sync_analysis; performs the Joplin API calls."""
         print(" Joplin sync is enabled. Preparing to send note...")
         
         if not self.app.joplin_api_key:
@@ -39,6 +64,16 @@ class JoplinSync:
         if not meeting_folder:
             print("❌ Joplin sync failed: Meeting folder not set.")
             return
+
+        # Extract timestamp from the folder name before any request is made
+        match = _MEETING_FOLDER_RE.match(meeting_folder)
+        try:
+            dt_obj = datetime(*map(int, match.groups())) if match else None
+        except ValueError:
+            dt_obj = None
+        if dt_obj is None:
+            print(f"❌ Joplin sync failed: Unexpected meeting folder name '{meeting_folder}'.")
+            return
         
         try:
             # Get or create the Joplin folder
@@ -48,9 +83,6 @@ class JoplinSync:
                 # Error message is printed inside the helper method
                 return
                 
-            # Extract timestamp from folder name like 'meeting-2025-12-11-00-50-12'
-            folder_timestamp_str = meeting_folder.replace('meeting-', '')
-            dt_obj = datetime.strptime(folder_timestamp_str, '%Y-%m-%d-%H-%M-%S')
             note_title = f"Meeting minutes {dt_obj.strftime('%Y-%m-%d %H:%M:%S')}"
             
             # Append final inconsistency note if present
@@ -67,11 +99,15 @@ class JoplinSync:
             
             # Make the request
             print(f"  - Sending note titled '{note_title}' to Joplin folder '{joplin_folder_name}'...")
-            response = requests.post(
-                f"{self.joplin_url}/notes",
-                params={"token": self.app.joplin_api_key},
-                json=note_data
-            )
+            response = self._post_note(note_data)
+            if not response.ok and joplin_folder_name in self._folder_id_cache:
+                # The cached folder may have been deleted or renamed in Joplin; resolve it again
+                print(f"  - Joplin rejected the note ({response.status_code}), looking up folder '{joplin_folder_name}' again...")
+                del self._folder_id_cache[joplin_folder_name]
+                note_data["parent_id"] = self._get_or_create_folder(joplin_folder_name)
+                if not note_data["parent_id"]:
+                    return
+                response = self._post_note(note_data)
             
             response.raise_for_status()  # Raise an exception for bad status codes
             print("✅ Note successfully synced to Joplin!")
@@ -80,6 +116,16 @@ class JoplinSync:
             print(f"❌ Joplin sync failed: An error occurred while communicating with the Joplin API: {e}")
         except Exception as e:
             print(f"❌ Joplin sync failed: An unexpected error occurred: {e}")
+
+    def _post_note(self, note_data):
+        # Encoded once to UTF-8 bytes; unlike json=, non-ASCII text isn't expanded to \u escapes
+        body = json.dumps(note_data, ensure_ascii=False).encode('utf-8')
+        return self.session.post(
+            f"{self.joplin_url}/notes",
+            params={"token": self.app.joplin_api_key},
+            data=body,
+            headers={"Content-Type": "application/json; charset=utf-8"}
+        )
     
     def _get_or_create_folder(self, folder_name):
         """
@@ -91,6 +137,16 @@ class JoplinSync:
         Returns:
             str: Folder ID or None if error
         """
+        folder_id = self._folder_id_cache.get(folder_name)
+        if folder_id:
+            return folder_id
+        folder_id = self._find_or_create_folder(folder_name)
+        if folder_id:
+            self._folder_id_cache[folder_name] = folder_id
+        return folder_id
+
+    def _find_or_create_folder(self, folder_name):
+        """Looks up folder_name in Joplin (paging through all folders) or creates it."""
         folders_endpoint = f"{self.joplin_url}/folders"
         page = 1
         
@@ -98,12 +154,12 @@ class JoplinSync:
             # 1. List all folders to find the folder, handling pagination
             print(f"  - Searching for Joplin folder '{folder_name}'...")
             while True:
-                response = requests.get(
+                response = self.session.get(
                     folders_endpoint,
                     params={"token": self.app.joplin_api_key, "page": page}
                 )
                 response.raise_for_status()
-                result = response.json()
+                result = orjson.loads(response.content) if orjson is not None else response.json()
                 folders = result.get('items', [])
                 
                 for folder in folders:
@@ -117,7 +173,7 @@ class JoplinSync:
             
             # 2. If not found, create it
             print(f"  - Joplin folder '{folder_name}' not found. Creating it...")
-            create_response = requests.post(
+            create_response = self.session.post(
                 folders_endpoint,
                 params={"token": self.app.joplin_api_key},
                 json={"title": folder_name}
@@ -9,36 +9,68 @@ Main entry point for the application. Handles device detection and configuration
 import sounddevice as sd
 import platform
 import os
+import time
 import config
 from ui_application import Application
 
 
+# Device classification rules, checked in order; the first matching keyword wins
+_DEVICE_TYPE_RULES = (
+    (('.monitor',), "Loopback/Monitor"),
+    (('brave', 'spotify', 'firefox', 'chrome'), "Anwendung"),
+    (('mic', 'headset', 'webcam', 'plantronics', 'camera'), "Mikrofon"),
+    (('hdmi', 'displayport'), "Display Audio"),
+    (('controller', 'jack', 'pulse', 'pipewire'), "System/Virtuell"),
+)
+
+# Last sd.query_devices() result and when it was taken; enumerating PortAudio devices is
+# slow, but a hot-plugged device has to show up after a few seconds
+_DEVICE_CACHE_TTL = 5.0
+_device_cache = None
+_device_cache_ts = 0.0
+
+
 def detect_device_type(device_name):
     """Classify audio device by name."""
     dev_name_lower = device_name.lower()
     
-    if '.monitor' in dev_name_lower:
-        return "Loopback/Monitor"
-    elif any(x in dev_name_lower for x in ['brave', 'spotify', 'firefox', 'chrome']):
-        return "Anwendung"
-    elif any(x in dev_name_lower for x in ['mic', 'headset', 'webcam', 'plantronics', 'camera']):
-        return "Mikrofon"
-    elif 'hdmi' in dev_name_lower or 'displayport' in dev_name_lower:
-        return "Display Audio"
-    elif any(x in dev_name_lower for x in ['controller', 'jack', 'pulse', 'pipewire']):
-        return "System/Virtuell"
-    else:
-        return "Unbekannt"
-
-
-def list_audio_devices():
-    """List all available audio input devices."""
+    for keywords, device_type in _DEVICE_TYPE_RULES:
+        for keyword in keywords:
+            if keyword in dev_name_lower:
+                return device_type
+    return "Unbekannt"
+
+
+def query_devices_cached():
+    """Returns sd.query_devices(), re-enumerating once the cached list is older than the TTL."""
+    global _device_cache, _device_cache_ts
+    if _device_cache is None or time.monotonic() - _device_cache_ts >= _DEVICE_CACHE_TTL:
+        _device_cache = sd.query_devices()
+        _device_cache_ts = time.monotonic()
+    return _device_cache
+
+
+def invalidate_device_cache():
+    """Drop the cached device list, e.g. after a device was attached or removed."""
+    global _device_cache
+    _device_cache = None
+
+
+def list_audio_devices(refresh=False):
+    """
+    List all available audio input devices.
+
+    Args:
+        refresh: Re-enumerate devices instead of using the cached list
+    """
     print("\n--- Audio-Geräte-Setup ---")
     print("Unten sehen Sie eine Liste der von Ihrem System erkannten Audio-Eingabegeräte.")
     print("Bitte wählen Sie die numerischen IDs für Ihr Mikrofon und die Audio-Quelle des Computers aus.")
     
     try:
-        devices = sd.query_devices()
+        if refresh:
+            invalidate_device_cache()
+        devices = query_devices_cached()
         valid_devices = []
         
         for dev in devices:
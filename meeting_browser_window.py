@@ -1,12 +1,52 @@
 import gi
 gi.require_version('Gtk', '3.0')
-from gi.repository import Gtk, GLib, GdkPixbuf, Gdk
+from gi.repository import Gtk, GLib, GdkPixbuf, Gdk, Gio, GObject
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 import os
 import threading
-import torch
+import time
+
+from audio_player import AudioPlayer, load_audio, open_audio_stream, read_audio_block
+
+# Seconds of audio handed to the output stream per write, and the slider refresh period
+PLAYBACK_CHUNK_SECONDS = 0.1
+SLIDER_UPDATE_INTERVAL = 0.1
+
+# Fixed card texts, built once instead of per card
+_STATUS_TEXT = {status: f"Status: {status}" for status in ("Recorded", "Analyzed", "Unknown")}
+_MEDIA_TEXT = "Media: Audio & Screenshots"
+
+
+@lru_cache(maxsize=1024)
+def _card_date_markup(created_at):
+    """Bold 'Mon DD, YYYY' markup for a created_at ISO timestamp; many cards share a day."""
+    return f"<b>{datetime.fromisoformat(created_at).strftime('%b %d, %Y')}</b>"
+
+
+# Distinct list/search/filter results kept until the next meeting write
+MEETING_QUERY_CACHE_SIZE = 64
+
+@lru_cache(maxsize=1024)
+def _meeting_audio_path(folder_name):
+    """Path of the mixed recording inside a meeting folder ('meeting-<ts>' -> 'meeting-<ts>-mixed.mp3')."""
+    now_str = folder_name.removeprefix("meeting-")
+    return os.path.join(folder_name, f"meeting-{now_str}-mixed.mp3")
+
+
+THUMBNAIL_SIZE = (150, 100)
+# Decoded thumbnails kept across meetings, keyed by (filepath, mtime)
+THUMBNAIL_CACHE_SIZE = 256
+
+class MeetingItem(GObject.Object):
+    """Wraps a meetings row so it can be stored in a Gio.ListStore."""
+
+    def __init__(self, meeting):
+        super().__init__()
+        self.meeting = meeting
 
-from audio_player import AudioPlayer, load_audio
 
 class MeetingBrowserWindow:
     def __init__(self, app):
@@ -17,16 +57,33 @@ class MeetingBrowserWindow:
         self.filter_options = {}
         self.stack = None # To manage different views (list, protocol)
 
-        self.player = None
         self.playback_thread = None
         self.playback_active = False
-        self.current_audio_data = None
+        self._playback_stop_event = None  # Set to end the current playback thread
+        self.current_audio_data = None  # Fully decoded audio, only if streaming isn't possible
+        self.current_audio_path = None  # Streamed block-wise; each playback thread opens its own handle
+        self.current_audio_frames = 0
         self.current_samplerate = None
         self.playback_position = 0
         self.current_meeting_folder = None
         self.current_meeting_data = None
         self.repurpose_output_view = None
         self.repurpose_combo = None
+        # Built on first use: the protocol view when a card is opened, the date
+        # calendars when the date range expander is opened
+        self._protocol_view_built = False
+        self.play_pause_button = None
+        self.start_date_calendar = None
+        self.end_date_calendar = None
+
+        # Screenshot thumbnails are decoded off the GTK thread
+        self._thumb_pool = ThreadPoolExecutor(max_workers=min(4, os.cpu_count() or 1), thread_name_prefix="thumbs")
+        self._thumb_cache = OrderedDict()
+        self._thumb_seq = 0  # Bumped per opened meeting; late results of older ones are dropped
+
+        # Query results keyed by (db method, args); cleared when db.meetings_epoch changes
+        self._query_cache = OrderedDict()
+        self._query_cache_epoch = None
 
 
     def create_or_show(self):
@@ -60,9 +117,7 @@ class MeetingBrowserWindow:
         meeting_list_view = self._create_meeting_list_view()
         self.stack.add_named(meeting_list_view, "list_view")
 
-        # Meeting Protocol View (initially empty, populated when a card is clicked)
-        meeting_protocol_view = self._create_meeting_protocol_view()
-        self.stack.add_named(meeting_protocol_view, "protocol_view")
+        # Meeting Protocol View is created in _show_meeting_protocol when a card is clicked
 
         # Load initial meetings (placeholder for now)
         self._load_meetings()
@@ -119,20 +174,10 @@ class MeetingBrowserWindow:
         self.status_filter.connect("changed", self._on_filter_changed)
         sidebar.pack_start(self.status_filter, False, False, 0)
 
-        # Date Range Filter
-        start_date_label = Gtk.Label(label="Start Date")
-        start_date_label.set_halign(Gtk.Align.START)
-        sidebar.pack_start(start_date_label, False, False, 0)
-        self.start_date_calendar = Gtk.Calendar()
-        self.start_date_calendar.connect("day-selected", self._on_filter_changed)
-        sidebar.pack_start(self.start_date_calendar, False, False, 0)
-
-        end_date_label = Gtk.Label(label="End Date")
-        end_date_label.set_halign(Gtk.Align.START)
-        sidebar.pack_start(end_date_label, False, False, 0)
-        self.end_date_calendar = Gtk.Calendar()
-        self.end_date_calendar.connect("day-selected", self._on_filter_changed)
-        sidebar.pack_start(self.end_date_calendar, False, False, 0)
+        # Date Range Filter (calendars are created when the expander is first opened)
+        date_expander = Gtk.Expander.new("Date Range")
+        date_expander.connect("notify::expanded", self._on_date_expander_toggled)
+        sidebar.pack_start(date_expander, False, False, 0)
 
         # Topic Filter
         topic_label = Gtk.Label(label="Topic")
@@ -159,6 +204,28 @@ class MeetingBrowserWindow:
 
         return sidebar
 
+    def _on_date_expander_toggled(self, expander, param):
+        if not expander.get_expanded() or self.start_date_calendar is not None:
+            return
+        date_box = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
+
+        start_date_label = Gtk.Label(label="Start Date")
+        start_date_label.set_halign(Gtk.Align.START)
+        date_box.pack_start(start_date_label, False, False, 0)
+        self.start_date_calendar = Gtk.Calendar()
+        self.start_date_calendar.connect("day-selected", self._on_filter_changed)
+        date_box.pack_start(self.start_date_calendar, False, False, 0)
+
+        end_date_label = Gtk.Label(label="End Date")
+        end_date_label.set_halign(Gtk.Align.START)
+        date_box.pack_start(end_date_label, False, False, 0)
+        self.end_date_calendar = Gtk.Calendar()
+        self.end_date_calendar.connect("day-selected", self._on_filter_changed)
+        date_box.pack_start(self.end_date_calendar, False, False, 0)
+
+        expander.add(date_box)
+        date_box.show_all()
+
     def _create_meeting_list_view(self):
         main_content_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=10)
         main_content_vbox.set_margin_right(10)
@@ -180,6 +247,9 @@ class MeetingBrowserWindow:
         self.meeting_list_box = Gtk.ListBox()
         self.meeting_list_box.set_selection_mode(Gtk.SelectionMode.NONE)
         self.meeting_list_box.set_css_name("meeting-cards-list") # For potential CSS styling
+        # Cards are created by the list box from this model; reloading replaces it in one splice
+        self._meeting_store = Gio.ListStore.new(MeetingItem)
+        self.meeting_list_box.bind_model(self._meeting_store, self._create_card_widget)
         scrolled_window.add(self.meeting_list_box)
 
         # Pagination (Placeholder)
@@ -314,18 +384,50 @@ class MeetingBrowserWindow:
         return protocol_vbox
 
     def _load_meetings(self, meetings=None):
-        # Clear existing cards
-        for child in self.meeting_list_box.get_children():
-            self.meeting_list_box.remove(child)
-
         if meetings is None:
-            meetings = self.app.db.get_all_meetings()
-        
-        for meeting in meetings:
-            self._add_meeting_card(meeting)
-        self.meeting_list_box.show_all()
-
-    def _add_meeting_card(self, meeting):
+            meetings = self._query_meetings('get_all_meetings')
+
+        # One model change that keeps the rows of meetings shown unchanged at the start and
+        # end of the list (e.g. while refining a search); only the rest is rebuilt
+        old_meetings = [self._meeting_store.get_item(i).meeting for i in range(self._meeting_store.get_n_items())]
+        prefix = 0
+        limit = min(len(old_meetings), len(meetings))
+        while prefix < limit and self._same_meeting(old_meetings[prefix], meetings[prefix]):
+            prefix += 1
+        suffix = 0
+        while (suffix < limit - prefix
+               and self._same_meeting(old_meetings[-1 - suffix], meetings[-1 - suffix])):
+            suffix += 1
+        items = [MeetingItem(meeting) for meeting in meetings[prefix:len(meetings) - suffix]]
+        self._meeting_store.splice(prefix, len(old_meetings) - prefix - suffix, items)
+
+    @staticmethod
+    def _same_meeting(a, b):
+        # Rows from the query cache are the same objects; otherwise compare contents,
+        # since a re-analysed meeting keeps its id but needs a fresh card
+        return a is b or tuple(a) == tuple(b)
+
+    def _query_meetings(self, method_name, *args):
+        """Runs a meetings query on self.app.db, reusing the result until meetings change."""
+        epoch = self.app.db.meetings_epoch
+        if epoch != self._query_cache_epoch:
+            self._query_cache.clear()
+            self._query_cache_epoch = epoch
+
+        key = (method_name,) + args
+        meetings = self._query_cache.get(key)
+        if meetings is not None:
+            self._query_cache.move_to_end(key)
+            return meetings
+
+        meetings = getattr(self.app.db, method_name)(*args)
+        self._query_cache[key] = meetings
+        if len(self._query_cache) > MEETING_QUERY_CACHE_SIZE:
+            self._query_cache.popitem(last=False)
+        return meetings
+
+    def _create_card_widget(self, item):
+        meeting = item.meeting
         card = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=5)
         card.get_style_context().add_class("meeting-card") # For potential CSS styling
         card.set_margin_bottom(10)
@@ -336,10 +438,7 @@ class MeetingBrowserWindow:
         card.set_valign(Gtk.Align.FILL)
 
         # Format created_at to a more readable date
-        created_at_dt = datetime.fromisoformat(meeting['created_at'])
-        formatted_date = created_at_dt.strftime("%b %d, %Y")
-
-        date_label = Gtk.Label(label=f"<b>{formatted_date}</b>", use_markup=True)
+        date_label = Gtk.Label(label=_card_date_markup(meeting['created_at']), use_markup=True)
         date_label.set_halign(Gtk.Align.START)
         card.pack_start(date_label, False, False, 0)
 
@@ -354,12 +453,12 @@ class MeetingBrowserWindow:
         card.pack_start(attendees_label, False, False, 0)
 
         status_text = meeting['status'] if meeting['status'] else "Unknown"
-        status_label = Gtk.Label(label=f"Status: {status_text}")
+        status_label = Gtk.Label(label=_STATUS_TEXT.get(status_text) or f"Status: {status_text}")
         status_label.set_halign(Gtk.Align.START)
         card.pack_start(status_label, False, False, 0)
 
         # Placeholder for media summary, as it's not directly in DB yet
-        media_label = Gtk.Label(label="Media: Audio & Screenshots")
+        media_label = Gtk.Label(label=_MEDIA_TEXT)
         media_label.set_halign(Gtk.Align.START)
         card.pack_start(media_label, False, False, 0)
 
@@ -371,9 +470,16 @@ class MeetingBrowserWindow:
 
         row = Gtk.ListBoxRow()
         row.add(card)
-        self.meeting_list_box.add(row)
+        row.show_all()
+        return row
 
     def _show_meeting_protocol(self, widget, meeting):
+        if not self._protocol_view_built:
+            meeting_protocol_view = self._create_meeting_protocol_view()
+            self.stack.add_named(meeting_protocol_view, "protocol_view")
+            meeting_protocol_view.show_all()
+            self._protocol_view_built = True
+
         self.current_meeting_data = meeting
         self.current_meeting_folder = meeting['folder_name']
         self.protocol_title_label.set_label(f"<big><b>{meeting['title'] if meeting['title'] else meeting['folder_name']}</b></big>")
@@ -393,38 +499,63 @@ class MeetingBrowserWindow:
         full_protocol_text = f"--- Transcript ---\n{transcript_text}\n\n--- Analysis ---\n{analysis_text}"
         self.protocol_text_view.get_buffer().set_text(full_protocol_text)
         
-        # Load audio data
+        # Open audio; it is decoded block by block during playback
+        self._stop_playback()
+        self._close_audio()
         try:
-            folder_name = meeting['folder_name']
-            now_str = folder_name.replace("meeting-", "")
-            audio_file = os.path.join(folder_name, f"meeting-{now_str}-mixed.mp3")
+            audio_file = _meeting_audio_path(meeting['folder_name'])
             if os.path.exists(audio_file):
-                self.current_audio_data, self.current_samplerate = load_audio(audio_file)
-                self.playback_slider.set_range(0, len(self.current_audio_data) / self.current_samplerate)
+                sound_file = open_audio_stream(audio_file)
+                if sound_file is not None:
+                    with sound_file:
+                        self.current_audio_frames = sound_file.frames
+                        self.current_samplerate = sound_file.samplerate
+                    self.current_audio_path = audio_file
+                else:
+                    self.current_audio_data, self.current_samplerate = load_audio(audio_file)
+                    self.current_audio_frames = len(self.current_audio_data)
+                self.playback_slider.set_range(0, self.current_audio_frames / self.current_samplerate)
+                self.playback_slider.set_value(0)
                 self.play_pause_button.set_sensitive(True)
             else:
-                self.current_audio_data = None
                 self.play_pause_button.set_sensitive(False)
         except Exception as e:
             print(f"Error loading audio: {e}")
-            self.current_audio_data = None
+            self._close_audio()
             self.play_pause_button.set_sensitive(False)
 
         # Load screenshots
         for child in self.screenshot_flowbox.get_children():
             self.screenshot_flowbox.remove(child)
         
+        self._thumb_seq += 1
+        seq = self._thumb_seq
         try:
             folder_name = meeting['folder_name']
-            screenshot_files = [f for f in os.listdir(folder_name) if f.endswith(".png")]
-            for screenshot_file in screenshot_files:
-                filepath = os.path.join(folder_name, screenshot_file)
-                pixbuf = GdkPixbuf.Pixbuf.new_from_file_at_size(filepath, 150, 100)
-                image = Gtk.Image.new_from_pixbuf(pixbuf)
-                button = Gtk.Button()
-                button.set_image(image)
-                button.connect("clicked", self._on_screenshot_clicked, filepath)
-                self.screenshot_flowbox.add(button)
+            screenshots = []
+            with os.scandir(folder_name) as entries:
+                for entry in entries:
+                    if not entry.name.endswith(".png") or not entry.is_file(follow_symlinks=False):
+                        continue
+                    st = entry.stat(follow_symlinks=False)
+                    if st.st_size:  # Skip screenshots that were never written
+                        screenshots.append((entry.path, st.st_mtime))
+            # Chronological order; listing order of the directory is arbitrary
+            screenshots.sort(key=lambda s: s[1])
+            # Buttons are added in this order right away; decoded thumbnails are set on
+            # them as the pool finishes, in whatever order that happens
+            for filepath, mtime in screenshots:
+                key = (filepath, mtime)
+                button = self._append_thumb(filepath)
+                pixbuf = self._thumb_cache.get(key)
+                if pixbuf is not None:
+                    self._thumb_cache.move_to_end(key)
+                    button.get_image().set_from_pixbuf(pixbuf)
+                    continue
+                future = self._thumb_pool.submit(GdkPixbuf.Pixbuf.new_from_file_at_size, filepath, *THUMBNAIL_SIZE)
+                future.add_done_callback(
+                    lambda f, key=key, button=button: GLib.idle_add(self._on_thumb_decoded, seq, key, button, f)
+                )
         except Exception as e:
             print(f"Error loading screenshots: {e}")
         
@@ -432,6 +563,30 @@ class MeetingBrowserWindow:
         self.stack.set_visible_child_name("protocol_view")
         self.sidebar.hide() # Hide sidebar in protocol view
 
+    def _on_thumb_decoded(self, seq, key, button, future):
+        try:
+            pixbuf = future.result()
+        except Exception as e:
+            print(f"Error loading screenshot {key[0]}: {e}")
+            if seq == self._thumb_seq:
+                self.screenshot_flowbox.remove(button.get_parent())
+            return False
+        self._thumb_cache[key] = pixbuf
+        if len(self._thumb_cache) > THUMBNAIL_CACHE_SIZE:
+            self._thumb_cache.popitem(last=False)
+        if seq == self._thumb_seq:  # Otherwise another meeting was opened meanwhile
+            button.get_image().set_from_pixbuf(pixbuf)
+        return False
+
+    def _append_thumb(self, filepath):
+        """Adds a thumbnail button for filepath; its image is set once the thumbnail is loaded."""
+        button = Gtk.Button()
+        button.set_image(Gtk.Image())
+        button.set_always_show_image(True)
+        button.connect("clicked", self._on_screenshot_clicked, filepath)
+        self.screenshot_flowbox.add(button)
+        return button
+
     def _on_reanalyze_clicked(self, widget):
         if self.current_meeting_folder:
             print(f"Re-analyzing meeting: {self.current_meeting_folder}")
@@ -456,8 +611,8 @@ class MeetingBrowserWindow:
         if not template:
             return
             
-        transcript = self.current_meeting_data.get('transcript', '')
-        analysis = self.current_meeting_data.get('analysis', '')
+        transcript = self.current_meeting_data['transcript'] or ''
+        analysis = self.current_meeting_data['analysis'] or ''
         full_text = f"--- Transcript ---\n{transcript}\n\n--- Analysis ---\n{analysis}"
 
         self.repurpose_generate_button.set_sensitive(False)
@@ -498,16 +653,30 @@ class MeetingBrowserWindow:
         scrolled_win.add(image)
 
         original_pixbuf = GdkPixbuf.Pixbuf.new_from_file(filepath)
+        # Resizing fires size-allocate continuously; rescale once it settles for 50 ms
+        rescale = {'size': None, 'scaled': None, 'timeout_id': 0}
+
+        def do_rescale():
+            rescale['timeout_id'] = 0
+            width, height = rescale['size']
+            if rescale['scaled'] != (width, height):
+                rescale['scaled'] = (width, height)
+                image.set_from_pixbuf(original_pixbuf.scale_simple(width, height, GdkPixbuf.InterpType.BILINEAR))
+            return False
 
         def on_size_allocate(widget, allocation):
-            scaled_pixbuf = original_pixbuf.scale_simple(
-                allocation.width,
-                allocation.height,
-                GdkPixbuf.InterpType.BILINEAR
-            )
-            image.set_from_pixbuf(scaled_pixbuf)
+            rescale['size'] = (allocation.width, allocation.height)
+            if rescale['timeout_id']:
+                GLib.source_remove(rescale['timeout_id'])
+            rescale['timeout_id'] = GLib.timeout_add(50, do_rescale)
+
+        def on_destroy(widget):
+            if rescale['timeout_id']:
+                GLib.source_remove(rescale['timeout_id'])
+                rescale['timeout_id'] = 0
 
         image.connect("size-allocate", on_size_allocate)
+        win.connect("destroy", on_destroy)
 
         win.show_all()
 
@@ -523,50 +692,89 @@ class MeetingBrowserWindow:
             self._start_playback()
 
     def _on_slider_changed(self, scale, scroll_type, value):
-        if self.current_audio_data is not None:
+        if self.current_audio_frames:
             self.playback_position = int(value * self.current_samplerate)
 
     def _start_playback(self):
-        if self.current_audio_data is None:
+        if not self.current_audio_frames:
             return
             
         self.playback_active = True
         self.play_pause_button.set_label("❚❚")
-        self.player = AudioPlayer(samplerate=self.current_samplerate)
-        self.playback_thread = threading.Thread(target=self._playback_thread_func)
+        self._playback_stop_event = threading.Event()
+        # The thread gets everything it uses, so a new meeting can be opened while it winds down
+        self.playback_thread = threading.Thread(
+            target=self._playback_thread_func,
+            args=(self._playback_stop_event, AudioPlayer(samplerate=self.current_samplerate),
+                  self.current_audio_path, self.current_audio_data,
+                  self.current_audio_frames, self.current_samplerate)
+        )
         self.playback_thread.daemon = True
         self.playback_thread.start()
 
     def _stop_playback(self):
+        # Returns at once; the thread notices between blocks and closes its player itself
         self.playback_active = False
-        if self.playback_thread and self.playback_thread.is_alive():
-            self.playback_thread.join()
-        if self.player:
-            self.player.close()
-            self.player = None
-        self.play_pause_button.set_label("▶")
-
-    def _playback_thread_func(self):
-        chunk_size = 1024
-        while self.playback_active and self.playback_position < len(self.current_audio_data):
-            end_pos = self.playback_position + chunk_size
-            chunk = self.current_audio_data[self.playback_position:end_pos]
-            self.player.add_audio(chunk)
-            self.playback_position = end_pos
-            GLib.idle_add(self._update_slider_position)
+        if self._playback_stop_event is not None:
+            self._playback_stop_event.set()
+            self._playback_stop_event = None
+        self.playback_thread = None
+        if self.play_pause_button:
+            self.play_pause_button.set_label("▶")
+
+    def _on_playback_finished(self, stop_event):
+        if stop_event is self._playback_stop_event:  # Not stopped or replaced meanwhile
+            self._stop_playback()
+        return False
+
+    def _playback_thread_func(self, stop_event, player, audio_path, audio_data, total_frames, samplerate):
+        # ~100 ms blocks instead of 1024 frames: fewer Python iterations and GIL handoffs
+        chunk_size = max(1024, int(samplerate * PLAYBACK_CHUNK_SECONDS))
+        audio_file = open_audio_stream(audio_path) if audio_path else None
+        file_position = None
+        last_slider_update = 0.0
+        try:
+            while not stop_event.is_set() and self.playback_position < total_frames:
+                if audio_file is not None:
+                    if file_position != self.playback_position:
+                        audio_file.seek(self.playback_position)  # First block or slider moved
+                    chunk = read_audio_block(audio_file, chunk_size)
+                    if not len(chunk):
+                        break
+                    end_pos = self.playback_position + len(chunk)
+                    file_position = end_pos
+                elif audio_data is not None:
+                    end_pos = self.playback_position + chunk_size
+                    chunk = audio_data[self.playback_position:end_pos]  # A view, not a copy
+                else:
+                    break
+                player.add_audio(chunk)
+                if stop_event.is_set():
+                    break  # Position may already belong to another meeting
+                self.playback_position = end_pos
+                now = time.monotonic()
+                if now - last_slider_update >= SLIDER_UPDATE_INTERVAL:
+                    last_slider_update = now
+                    GLib.idle_add(self._update_slider_position)
+        except Exception as e:
+            print(f"Error during playback: {e}")
+        finally:
+            player.close()
+            if audio_file is not None:
+                audio_file.close()
         
         # When playback finishes naturally
-        GLib.idle_add(self._stop_playback)
+        GLib.idle_add(self._on_playback_finished, stop_event)
 
     def _update_slider_position(self):
-        if self.current_audio_data is not None:
+        if self.current_audio_frames:
             pos_in_seconds = self.playback_position / self.current_samplerate
             self.playback_slider.set_value(pos_in_seconds)
 
     def _on_search_changed(self, search_entry):
         query = search_entry.get_text().strip()
         if query:
-            meetings = self.app.db.search_meetings(query)
+            meetings = self._query_meetings('search_meetings', query)
             self._load_meetings(meetings)
         else:
             self._load_meetings()
@@ -574,40 +782,44 @@ class MeetingBrowserWindow:
     def _on_filter_changed(self, widget):
         status = self.status_filter.get_active_text()
         
-        start_date_tuple = self.start_date_calendar.get_date()
         start_date_iso = None
-        if start_date_tuple[2] != 0:
-            start_date = datetime(start_date_tuple[0], start_date_tuple[1] + 1, start_date_tuple[2])
-            start_date_iso = start_date.isoformat()
-
-        end_date_tuple = self.end_date_calendar.get_date()
         end_date_iso = None
-        if end_date_tuple[2] != 0:
-            end_date = datetime(end_date_tuple[0], end_date_tuple[1] + 1, end_date_tuple[2], 23, 59, 59)
-            end_date_iso = end_date.isoformat()
+        if self.start_date_calendar is not None:
+            start_date_tuple = self.start_date_calendar.get_date()
+            if start_date_tuple[2] != 0:
+                start_date = datetime(start_date_tuple[0], start_date_tuple[1] + 1, start_date_tuple[2])
+                start_date_iso = start_date.isoformat()
+
+            end_date_tuple = self.end_date_calendar.get_date()
+            if end_date_tuple[2] != 0:
+                end_date = datetime(end_date_tuple[0], end_date_tuple[1] + 1, end_date_tuple[2], 23, 59, 59)
+                end_date_iso = end_date.isoformat()
         
         topic = self.topic_filter.get_text().strip()
         attendees = self.attendees_filter.get_text().strip()
 
-        meetings = self.app.db.filter_meetings(
-            status=status, 
-            start_date=start_date_iso, 
-            end_date=end_date_iso,
-            topic=topic,
-            attendees=attendees
+        meetings = self._query_meetings(
+            'filter_meetings', status, start_date_iso, end_date_iso, topic, attendees
         )
         self._load_meetings(meetings)
 
     def _on_clear_filters_clicked(self, button):
         self.status_filter.set_active(0)
-        self.start_date_calendar.select_day(1)
-        self.start_date_calendar.select_day(0)
-        self.end_date_calendar.select_day(1)
-        self.end_date_calendar.select_day(0)
+        if self.start_date_calendar is not None:
+            self.start_date_calendar.select_day(1)
+            self.start_date_calendar.select_day(0)
+            self.end_date_calendar.select_day(1)
+            self.end_date_calendar.select_day(0)
         self.topic_filter.set_text("")
         self.attendees_filter.set_text("")
         self._load_meetings()
 
+    def _close_audio(self):
+        self.current_audio_path = None
+        self.current_audio_data = None
+        self.current_audio_frames = 0
+        self.playback_position = 0
+
     def _on_delete_event(self, widget, event):
         self._stop_playback()
         self._window.hide()
@@ -1,6 +1,7 @@
 "Integration with Ollama for meeting minutes analysis."
 
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import os
 import base64
@@ -25,11 +26,16 @@ class OllamaAnalyzer:
         self.endpoint = f"{base_url}/api/generate"
         self.screenshots = []  # Store screenshot paths
         self.language = language  # Language for analysis output
+        # Keep-alive connections reused across requests to the same Ollama server
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=4)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _check_connection(self):
         """Check if Ollama is running and accessible."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             return response.status_code == 200
         except Exception as e:
             print(f"❌ Ollama connection failed: {e}")
@@ -38,7 +44,7 @@ class OllamaAnalyzer:
     def _check_model_available(self):
         """Check if the specified model is available."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=5)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=5)
             if response.status_code == 200:
                 models = response.json().get("models", [])
                 model_names = [m.get("name", "") for m in models]
@@ -138,7 +144,7 @@ class OllamaAnalyzer:
             print(f"\n🤖 Sending meeting minutes to Ollama ({self.model}) for analysis in {lang_display} {screenshot_msg}...")
             
             # Call Ollama API
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json=payload,
                 timeout=3600  # 1 hour timeout for analysis
@@ -352,7 +358,7 @@ Desired Output Format:
         prompt = "\n\n".join(prompt_parts)
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "model": self.model,
@@ -403,7 +409,7 @@ Desired Output Format:
             return {'success': False, 'error': 'Invalid mode specified'}
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "model": self.model,
@@ -447,7 +453,7 @@ Desired Output Format:
         prompt = f"Based on the following conversation, provide a concise summary of the discussion. The summary should be in the same language as the conversation.\n\nConversation:\n{history}\n\nSummary:"
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "model": self.model,
@@ -510,7 +516,7 @@ If no such issues are found, respond with "No inconsistencies found."
 IMPORTANT: Your response should be in the same language as CURRENT MEETING HISTORY content.
 """
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "model": self.model,
@@ -553,7 +559,7 @@ IMPORTANT: Your response should be in the same language as CURRENT MEETING HISTO
         prompt = f"Based on the following meeting transcript, suggest one concise and descriptive title of no more than 10 words,just the title, do not comment or add other text. The title should be in the same language as the transcript.\n\nTranscript:\n{meeting_minutes}\n\nSuggested title:"
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "model": self.model,
@@ -606,7 +612,7 @@ IMPORTANT: Your response should be in the same language as CURRENT MEETING HISTO
 
         try:
             print(f"Repurposing content for template: '{template}'...")
-            response = requests.post(
+            response = self.session.post(
                 self.endpoint,
                 json={
                     "model": self.model,
@@ -3,7 +3,36 @@ gi.require_version('Gtk', '3.0')
 from gi.repository import Gtk, Gdk
 from history_window import HistoryWindow
 
+# A dark, rounded, modern look inspired by the image
+_CSS = b"""
+#RecordingIndicatorWindow {
+    background-color: #2E2E2E;
+    border-radius: 20px;
+    border: 1px solid #4A4A4A;
+}
+#RecordingIndicatorWindow GtkButton {
+    background-color: #3B3B3B;
+    border: 1px solid #555;
+    border-radius: 10px;
+    color: white;
+    min-height: 30px;
+    min-width: 30px;
+}
+#RecordingIndicatorWindow GtkButton:hover {
+    background-color: #4A4A4A;
+}
+#RecordingIndicatorWindow GtkEntry {
+    background-color: #1E1E1E;
+    color: #E0E0E0;
+    border: 1px solid #4A4A4A;
+    border-radius: 10px;
+    padding: 5px 10px;
+}
+"""
+
 class RecordingIndicatorWindow(Gtk.Window):
+    _style_provider = None
+
     def __init__(self, application):
         super().__init__(title="Recording")
         self.app = application
@@ -15,39 +44,15 @@ class RecordingIndicatorWindow(Gtk.Window):
 
         # Basic styling
         self.set_name("RecordingIndicatorWindow")
-        style_provider = Gtk.CssProvider()
-        # A dark, rounded, modern look inspired by the image
-        css = """
-        #RecordingIndicatorWindow {
-            background-color: #2E2E2E;
-            border-radius: 20px;
-            border: 1px solid #4A4A4A;
-        }
-        #RecordingIndicatorWindow GtkButton {
-            background-color: #3B3B3B;
-            border: 1px solid #555;
-            border-radius: 10px;
-            color: white;
-            min-height: 30px;
-            min-width: 30px;
-        }
-        #RecordingIndicatorWindow GtkButton:hover {
-            background-color: #4A4A4A;
-        }
-        #RecordingIndicatorWindow GtkEntry {
-            background-color: #1E1E1E;
-            color: #E0E0E0;
-            border: 1px solid #4A4A4A;
-            border-radius: 10px;
-            padding: 5px 10px;
-        }
-        """
-        style_provider.load_from_data(css.encode())
-        Gtk.StyleContext.add_provider_for_screen(
-            Gdk.Screen.get_default(),
-            style_provider,
-            Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
-        )
+        # The provider is screen-wide, so it is added once rather than per window
+        if RecordingIndicatorWindow._style_provider is None:
+            RecordingIndicatorWindow._style_provider = Gtk.CssProvider()
+            RecordingIndicatorWindow._style_provider.load_from_data(_CSS)
+            Gtk.StyleContext.add_provider_for_screen(
+                Gdk.Screen.get_default(),
+                RecordingIndicatorWindow._style_provider,
+                Gtk.STYLE_PROVIDER_PRIORITY_APPLICATION
+            )
 
         hbox = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=8)
         hbox.set_margin_start(10)
@@ -7,10 +7,10 @@ from datetime import datetime
 import numpy as np
 import torch
 import torchaudio
-import torchaudio.transforms as T
 import whisper
 from pyannote.audio import Pipeline
 
+from audio_recorder import get_resampler, int16_to_float32
 from config import WHISPER_SAMPLE_RATE, load_user_settings
 from ollama_analyzer import OllamaAnalyzer
 import soundfile as sf
@@ -50,13 +50,15 @@ class Transcriber(threading.Thread):
         """Main transcription loop."""
         while not self.stop_event.is_set():
             try:
-                audio_float, source = self.audio_queue.get(timeout=0.5)
+                chunk_int16, source, samplerate = self.audio_queue.get(timeout=0.5)
                 # If real-time recording is not enabled, skip processing incoming audio
                 # and avoid printing to the console.
                 if not getattr(self, 'recording_enabled', False):
                     self.audio_queue.task_done()
                     continue
 
+                audio_float = self._prepare_chunk(chunk_int16, samplerate)
+
                 print(f"\n--- Transkribiere {source} ({len(audio_float)/WHISPER_SAMPLE_RATE:.1f}s) ---")
 
                 if source == "LOOPBACK":
@@ -82,6 +84,14 @@ class Transcriber(threading.Thread):
                 print(f"   Traceback: {traceback.format_exc()}")
                 self.audio_queue.task_done()
 
+    def _prepare_chunk(self, chunk_int16, samplerate):
+        """Convert a raw int16 chunk from the recorder to float32 at WHISPER_SAMPLE_RATE."""
+        audio_float = int16_to_float32(chunk_int16)
+        if samplerate == WHISPER_SAMPLE_RATE:
+            return audio_float
+        resampler = get_resampler(samplerate, WHISPER_SAMPLE_RATE)
+        return resampler(torch.from_numpy(audio_float)).numpy()
+
     def _transcribe_standard(self, audio_float, source):
         """Perform standard transcription for mic or when diarization is unavailable."""
         if source == "MIC":
@@ -275,8 +285,7 @@ class Transcriber(threading.Thread):
             
             # Resample to WHISPER_SAMPLE_RATE if needed
             if sample_rate != WHISPER_SAMPLE_RATE:
-                resampler = T.Resample(orig_freq=sample_rate, new_freq=WHISPER_SAMPLE_RATE)
-                audio_channel = resampler(audio_channel)
+                audio_channel = get_resampler(sample_rate, WHISPER_SAMPLE_RATE)(audio_channel)
                 print(f"🔄 Resampled zu {WHISPER_SAMPLE_RATE} Hz")
             
             # Ensure proper float32 format and clone to avoid reference issues
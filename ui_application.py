@@ -22,7 +22,7 @@ from screenshot_manager import ScreenshotManager
 from config import load_user_settings, save_user_settings
 import config as cfg
 from database import Database
-from folder_indexer import FolderIndexer
+from folder_indexer import FolderIndexer, sha256_file
 
 # Import the new modules
 from system_tray import SystemTrayManager
@@ -37,6 +37,9 @@ from ollama_analyzer import OllamaAnalyzer
 from meeting_browser_window import MeetingBrowserWindow # New Import
 from chat_browser_window import ChatBrowserWindow # New Import
 
+# File types the chat window's upload button can extract text from
+UPLOAD_EXTENSIONS = ('.txt', '.md', '.htm', '.html', '.docx', '.xlsx', '.pdf')
+
 
 class Application:
     """Main application handling UI, device management, and file recording."""
@@ -160,6 +163,10 @@ class Application:
         
         # Source folders
         self.source_folders = settings.get('source_folders', [])
+        # Same folders as a set for membership checks; the list keeps display order
+        self._source_folders_set = set(self.source_folders)
+        # Guards both while the UI mutates them and watcher threads take snapshots
+        self._source_folders_lock = threading.Lock()
         
         # Joplin settings
         self.joplin_api_key = settings.get('joplin_api_key', '')
@@ -727,9 +734,16 @@ class Application:
         remove_folder_btn = Gtk.Button(label="Remove")
         remove_folder_btn.connect("clicked", self.folder_manager.on_remove_folder_clicked)
         
+        l_interval = Gtk.Label(label="Check every (s):")
+        adj = Gtk.Adjustment(value=self.folder_manager.interval, lower=10, upper=86400, step_increment=10, page_increment=300)
+        self.watch_interval_spin = Gtk.SpinButton(adjustment=adj)
+        self.watch_interval_spin.connect("value-changed", self.folder_manager.on_watch_interval_changed)
+
         folder_button_box = Gtk.Box(orientation=Gtk.Orientation.HORIZONTAL, spacing=6)
         folder_button_box.pack_start(add_folder_btn, False, False, 0)
         folder_button_box.pack_start(remove_folder_btn, False, False, 0)
+        folder_button_box.pack_end(self.watch_interval_spin, False, False, 0)
+        folder_button_box.pack_end(l_interval, False, False, 0)
         
         folder_vbox = Gtk.Box(orientation=Gtk.Orientation.VERTICAL, spacing=6)
         folder_vbox.pack_start(scrolled_win, True, True, 0)
@@ -1892,7 +1906,7 @@ class Application:
         print(f"Hybrid search found {len(combined_docs)} unique context documents.")
         return combined_docs
     
-    def _process_uploaded_file(self, filepath):
+    def _process_uploaded_file(self, filepath, session_id=None):
         """Read a file, extract text content based on its type, and add it to the ChromaDB collection."""
         coll = getattr(self, 'chroma_collection', None)
         if not coll:
@@ -1901,11 +1915,30 @@ class Application:
         
         content = ""
         error_message = None
+
+        _, extension = os.path.splitext(filepath)
+        extension = extension.lower()
+        if extension not in UPLOAD_EXTENSIONS:
+            error_message = f"Unsupported file type: {extension}. Please upload TXT, MD, HTML, HTM, DOCX, XLSX, or PDF."
+            GLib.idle_add(self.chat_window.append_text, "System", error_message)
+            return
+
+        # Skip files whose exact contents were already uploaded to this chat session
+        file_hash = None
+        if session_id:
+            try:
+                with open(filepath, 'rb') as f:
+                    file_hash = sha256_file(f)
+            except OSError as e:
+                GLib.idle_add(self.chat_window.append_text, "System", f"Failed to read file '{os.path.basename(filepath)}': {e}")
+                return
+            if not self.db.claim_uploaded_file(session_id, file_hash, os.path.basename(filepath)):
+                GLib.idle_add(self.chat_window.append_text, "System",
+                             f"'{os.path.basename(filepath)}' was already uploaded, skipping.")
+                return
+        indexed = False
         
         try:
-            _, extension = os.path.splitext(filepath)
-            extension = extension.lower()
-            
             if extension in ['.txt', '.md']:
                 with open(filepath, 'r', encoding='utf-8') as f:
                     content = f.read()
@@ -1944,12 +1977,6 @@ class Application:
                     if extracted_text:
                         full_text.append(extracted_text)
                 content = '\n'.join(full_text)
-            else:
-                error_message = f"Unsupported file type: {extension}. Please upload TXT, MD, HTML, HTM, DOCX, XLSX, or PDF."
-            
-            if error_message:
-                GLib.idle_add(self.chat_window.append_text, "System", error_message)
-                return
             
             if not content.strip():
                 error_message = f"No text content found in file '{os.path.basename(filepath)}'."
@@ -1972,6 +1999,7 @@ class Application:
                 ids=[doc_id]
             )
             
+            indexed = True
             GLib.idle_add(self.chat_window.append_text, "System", 
                          f"Successfully uploaded and indexed '{os.path.basename(filepath)}'.")
             
@@ -1981,6 +2009,10 @@ class Application:
             import traceback
             traceback.print_exc()
             GLib.idle_add(self.chat_window.append_text, "System", error_message)
+        finally:
+            if not indexed and file_hash:
+                # Let the user retry once the problem is fixed
+                self.db.release_uploaded_file(session_id, file_hash)
     
     # ==================== Application Lifecycle ====================
     